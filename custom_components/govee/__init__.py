@@ -32,7 +32,7 @@ from .const import (
     DEFAULT_POLL_INTERVAL,
     DOMAIN,
 )
-from .coordinator import GoveeCoordinator
+from .coordinator import GoveeCoordinator, async_remove_scene_store
 from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -216,6 +216,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: GoveeConfigEntry) -> bo
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: GoveeConfigEntry) -> None:
+    """Remove a config entry's persisted scene caches.
+
+    Args:
+        hass: Home Assistant instance.
+        entry: Config entry being removed.
+    """
+    await async_remove_scene_store(hass, entry.entry_id)
+
+
 async def _async_cleanup_orphaned_entities(
     hass: HomeAssistant,
     entry: ConfigEntry,
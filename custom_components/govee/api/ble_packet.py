@@ -18,7 +18,10 @@ Music Mode packet:
 
 from __future__ import annotations
 
-import base64
+from binascii import b2a_base64
+from collections.abc import Sequence
+from functools import lru_cache
+import struct
 
 # Music mode packet constants
 MUSIC_PACKET_PREFIX = 0x33
@@ -29,6 +32,18 @@ MUSIC_MODE_INDICATOR = 0x01
 DREAMVIEW_COMMAND = 0x05  # Same as music mode command byte
 DREAMVIEW_INDICATOR = 0x04  # Scene mode indicator (vs 0x01 for music)
 
+# Precompiled layout: 19-byte command body (zero padded) + checksum byte
+_PACKET_STRUCT = struct.Struct("19sB")
+
+# Zero-filled 20-byte packets with the fixed header bytes already set.
+# Builders copy a template and patch only the variable bytes + checksum.
+_MUSIC_MODE_TEMPLATE = bytearray(
+    [MUSIC_PACKET_PREFIX, MUSIC_MODE_COMMAND, MUSIC_MODE_INDICATOR] + [0x00] * 17
+)
+_DREAMVIEW_TEMPLATE = bytearray(
+    [MUSIC_PACKET_PREFIX, DREAMVIEW_COMMAND, DREAMVIEW_INDICATOR] + [0x00] * 17
+)
+
 # DIY style name to value mapping for select entity
 DIY_STYLE_NAMES: dict[str, int] = {
     "Fade": 0x00,
@@ -39,11 +54,11 @@ DIY_STYLE_NAMES: dict[str, int] = {
 }
 
 
-def calculate_checksum(data: list[int]) -> int:
+def calculate_checksum(data: Sequence[int]) -> int:
     """Calculate XOR checksum of all bytes.
 
     Args:
-        data: List of byte values to checksum.
+        data: Byte values to checksum (list of ints, bytes or memoryview).
 
     Returns:
         XOR of all bytes, masked to 8 bits.
@@ -65,19 +80,42 @@ def build_packet(data: list[int]) -> bytes:
     Returns:
         20-byte packet as bytes.
     """
-    packet = list(data)
+    # Truncate to 19 bytes; "19s" zero-pads shorter data. Zero padding does
+    # not change the XOR, so the checksum can be taken over the body as-is.
+    body = bytes(data[:19])
+    return _PACKET_STRUCT.pack(body, calculate_checksum(body))
+
+
+def _build_music_mode_packet(enabled: bool, sensitivity: int) -> bytes:
+    """Build a music mode packet from the template (sensitivity pre-clamped)."""
+    # Packet: 33 05 01 [ENABLED] [SENSITIVITY] ... [XOR]
+    packet = _MUSIC_MODE_TEMPLATE[:]
+    packet[3] = 0x01 if enabled else 0x00
+    packet[4] = sensitivity
+    packet[19] = calculate_checksum(memoryview(packet)[:19])
+    return bytes(packet)
 
-    # Pad to 19 bytes
-    while len(packet) < 19:
-        packet.append(0x00)
 
-    # Truncate if too long
-    packet = packet[:19]
+def _build_dreamview_packet(enabled: bool) -> bytes:
+    """Build a DreamView packet from the template."""
+    # Packet: 33 05 04 [enabled] 00...00 [XOR]
+    packet = _DREAMVIEW_TEMPLATE[:]
+    packet[3] = 0x01 if enabled else 0x00
+    packet[19] = calculate_checksum(memoryview(packet)[:19])
+    return bytes(packet)
 
-    # Append checksum
-    packet.append(calculate_checksum(packet))
 
-    return bytes(packet)
+# The input space of both builders is small enough to enumerate, so every
+# packet is built once at import and the public builders are table lookups.
+# Indexed as [enabled][sensitivity] and [enabled] respectively.
+_MUSIC_MODE_PACKETS: tuple[tuple[bytes, ...], ...] = tuple(
+    tuple(_build_music_mode_packet(enabled, s) for s in range(101))
+    for enabled in (False, True)
+)
+_DREAMVIEW_PACKETS: tuple[bytes, ...] = (
+    _build_dreamview_packet(False),
+    _build_dreamview_packet(True),
+)
 
 
 def build_music_mode_packet(enabled: bool, sensitivity: int = 50) -> bytes:
@@ -92,18 +130,7 @@ def build_music_mode_packet(enabled: bool, sensitivity: int = 50) -> bytes:
     """
     # Clamp sensitivity to valid range
     sensitivity = max(0, min(100, sensitivity))
-
-    # Build command data
-    # Packet: 33 05 01 [ENABLED] [SENSITIVITY] ...
-    data = [
-        MUSIC_PACKET_PREFIX,  # 0x33 - Standard command prefix
-        MUSIC_MODE_COMMAND,  # 0x05 - Color/mode command
-        MUSIC_MODE_INDICATOR,  # 0x01 - Music mode indicator
-        0x01 if enabled else 0x00,  # Enabled state
-        sensitivity,  # Sensitivity 0-100
-    ]
-
-    return build_packet(data)
+    return _MUSIC_MODE_PACKETS[1 if enabled else 0][sensitivity]
 
 
 def build_dreamview_packet(enabled: bool) -> bytes:
@@ -118,23 +145,20 @@ def build_dreamview_packet(enabled: bool) -> bytes:
     Returns:
         20-byte BLE packet for DreamView command.
     """
-    # Packet: 33 05 04 [enabled] 00...00 [XOR]
-    data = [
-        MUSIC_PACKET_PREFIX,  # 0x33 - Standard command prefix
-        DREAMVIEW_COMMAND,  # 0x05 - Color/mode command
-        DREAMVIEW_INDICATOR,  # 0x04 - Scene mode indicator
-        0x01 if enabled else 0x00,  # Enabled state
-    ]
-    return build_packet(data)
+    return _DREAMVIEW_PACKETS[1 if enabled else 0]
 
 
+@lru_cache(maxsize=256)
 def encode_packet_base64(packet: bytes) -> str:
     """Base64 encode a packet for ptReal command.
 
+    Results are cached: the builders above only ever produce a few hundred
+    distinct packets, so repeated commands reuse the encoded string.
+
     Args:
         packet: Raw BLE packet bytes.
 
     Returns:
         Base64-encoded ASCII string.
     """
-    return base64.b64encode(packet).decode("ascii")
+    return b2a_base64(packet, newline=False).decode("ascii")
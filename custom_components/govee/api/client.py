@@ -7,6 +7,7 @@ Implements IApiClient protocol.
 from __future__ import annotations
 
 import logging
+import sys
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -45,6 +46,26 @@ RETRY_FACTOR = 2.0  # Exponential factor
 NO_RETRY_STATUSES = {400, 401, 403, 404}
 
 
+def _parse_scene_options(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Collect scene options from a scenes or DIY scenes response.
+
+    Scene names are interned: devices of the same model report identical
+    scene lists, so the cached copies share one string per name.
+    """
+    scenes: list[dict[str, Any]] = []
+    capabilities = data.get("payload", {}).get("capabilities", [])
+    for cap in capabilities:
+        # DIY scenes endpoint also returns dynamic_scene type (diyScene instance)
+        if cap.get("type") == "devices.capabilities.dynamic_scene":
+            options = cap.get("parameters", {}).get("options", [])
+            for option in options:
+                name = option.get("name")
+                if isinstance(name, str):
+                    option["name"] = sys.intern(name)
+            scenes.extend(options)
+    return scenes
+
+
 class GoveeApiClient:
     """Async HTTP client for Govee Cloud API v2.0.
 
@@ -369,13 +390,7 @@ class GoveeApiClient:
             ) as response:
                 data = await self._handle_response(response)
 
-                scenes = []
-                capabilities = data.get("payload", {}).get("capabilities", [])
-                for cap in capabilities:
-                    if cap.get("type") == "devices.capabilities.dynamic_scene":
-                        params = cap.get("parameters", {})
-                        options = params.get("options", [])
-                        scenes.extend(options)
+                scenes = _parse_scene_options(data)
 
                 _LOGGER.debug(
                     "Fetched %d scenes for device %s",
@@ -422,14 +437,7 @@ class GoveeApiClient:
             ) as response:
                 data = await self._handle_response(response)
 
-                scenes = []
-                capabilities = data.get("payload", {}).get("capabilities", [])
-                for cap in capabilities:
-                    # DIY scenes endpoint returns dynamic_scene type with diyScene instance
-                    if cap.get("type") == "devices.capabilities.dynamic_scene":
-                        params = cap.get("parameters", {})
-                        options = params.get("options", [])
-                        scenes.extend(options)
+                scenes = _parse_scene_options(data)
 
                 _LOGGER.debug(
                     "Fetched %d DIY scenes for device %s",
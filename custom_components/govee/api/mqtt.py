@@ -273,7 +273,7 @@ class GoveeAwsIotClient:
                     # Subscribe to account topic for all device updates
                     topic = self._credentials.account_topic
                     await client.subscribe(topic)
-                    _LOGGER.debug("Subscribed to topic: %s", topic[:30] + "...")
+                    _LOGGER.debug("Subscribed to topic: %.30s...", topic)
 
                     async for message in client.messages:
                         if not self._running:
@@ -432,8 +432,8 @@ class GoveeAwsIotClient:
         try:
             await self._client.publish(device_topic, json.dumps(payload))
             _LOGGER.debug(
-                "Published ptReal to %s for device %s (sku=%s, packets=%d)",
-                device_topic[:30] + "...",
+                "Published ptReal to %.30s... for device %s (sku=%s, packets=%d)",
+                device_topic,
                 device_id,
                 sku,
                 len(packets),
@@ -8,12 +8,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import replace
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
@@ -27,7 +32,21 @@ from .api import (
 )
 from .api.auth import GoveeAuthClient
 from .const import DOMAIN
-from .models import GoveeDevice, GoveeDeviceState
+from .models import (
+    BrightnessCommand,
+    ColorCommand,
+    ColorTempCommand,
+    DeviceCommand,
+    DIYSceneCommand,
+    GoveeDevice,
+    GoveeDeviceState,
+    ModeCommand,
+    MusicModeCommand,
+    PowerCommand,
+    SceneCommand,
+    ToggleCommand,
+)
+from .models.device import INSTANCE_DREAMVIEW, INSTANCE_HDMI_SOURCE
 from .protocols import IStateObserver
 from .repairs import (
     async_create_auth_issue,
@@ -38,14 +57,169 @@ from .repairs import (
     async_delete_rate_limit_issue,
 )
 
-if TYPE_CHECKING:
-    from .models.commands import DeviceCommand
-
 _LOGGER = logging.getLogger(__name__)
 
 # State fetch timeout per device
 STATE_FETCH_TIMEOUT = 30
 
+# Maximum concurrent REST requests during polling and discovery, so large
+# installs don't burst through the per-minute rate limit
+MAX_CONCURRENT_REQUESTS = 8
+
+# Scene lists rarely change; refetch them hourly. Failed fetches are cached
+# for a shorter period so a transient error is retried without hammering
+# the API on every entity lookup.
+SCENE_CACHE_TTL = 3600
+SCENE_CACHE_ERROR_TTL = 300
+
+# Scene caches are persisted per config entry so a restart doesn't refetch
+# every scene list; writes are batched since discovery fills many at once
+SCENE_STORE_VERSION = 1
+SCENE_STORE_SAVE_DELAY = 10
+
+# device_id -> (expiry timestamp, scenes). Wall-clock expiry so entries
+# stay valid across restarts.
+_SceneCache = dict[str, tuple[float, list[dict[str, Any]]]]
+
+
+# (flag, fields carried over, log label) for optimistic state the REST API
+# doesn't report or returns stale: kept across polls while the device is on
+_PRESERVED_OPTIMISTIC_STATE: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("active_scene", ("active_scene",), "scene"),
+    ("dreamview_enabled", ("dreamview_enabled",), "DreamView"),
+    (
+        "music_mode_enabled",
+        (
+            "music_mode_enabled",
+            "music_mode_value",
+            "music_mode_name",
+            "music_sensitivity",
+        ),
+        "music mode",
+    ),
+    ("active_diy_scene", ("active_diy_scene",), "DIY scene"),
+)
+
+
+def _optimistic_mode(state: GoveeDeviceState, command: ModeCommand) -> None:
+    if command.mode_instance == INSTANCE_HDMI_SOURCE:
+        state.apply_optimistic_hdmi_source(command.value)
+
+
+def _optimistic_toggle(state: GoveeDeviceState, command: ToggleCommand) -> None:
+    # Only DreamView is tracked; night light etc. have no state field
+    if command.toggle_instance == INSTANCE_DREAMVIEW:
+        state.apply_optimistic_dreamview(command.enabled)
+
+
+# Command type -> optimistic state change. MusicModeCommand is handled by the
+# coordinator since it needs the device's mode names.
+_OPTIMISTIC_HANDLERS: dict[
+    type[DeviceCommand], Callable[[GoveeDeviceState, Any], None]
+] = {
+    PowerCommand: lambda state, cmd: state.apply_optimistic_power(cmd.power_on),
+    BrightnessCommand: lambda state, cmd: state.apply_optimistic_brightness(
+        cmd.brightness
+    ),
+    ColorCommand: lambda state, cmd: state.apply_optimistic_color(cmd.color),
+    ColorTempCommand: lambda state, cmd: state.apply_optimistic_color_temp(
+        cmd.kelvin
+    ),
+    SceneCommand: lambda state, cmd: state.apply_optimistic_scene(str(cmd.scene_id)),
+    DIYSceneCommand: lambda state, cmd: state.apply_optimistic_diy_scene(
+        str(cmd.scene_id)
+    ),
+    ModeCommand: _optimistic_mode,
+    ToggleCommand: _optimistic_toggle,
+}
+
+
+class _SceneStore(Store[dict[str, Any]]):
+    """Store for a config entry's scene caches."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Discard caches stored in another format; they are refetched."""
+        return {}
+
+
+def _scene_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding a config entry's persisted scene caches."""
+    return _SceneStore(hass, SCENE_STORE_VERSION, f"{DOMAIN}.scenes.{entry_id}")
+
+
+async def async_remove_scene_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete a config entry's persisted scene caches."""
+    await _scene_store(hass, entry_id).async_remove()
+
+
+def _is_fresh(cache: _SceneCache, device_id: str) -> bool:
+    """Return True if the cached scenes for a device haven't expired."""
+    entry = cache.get(device_id)
+    return entry is not None and time.time() < entry[0]
+
+
+def _load_scene_cache(data: Any) -> _SceneCache:
+    """Rebuild a scene cache from stored data.
+
+    Expired and malformed entries are dropped so a bad store can't break setup.
+    """
+    if not isinstance(data, dict):
+        return {}
+    now = time.time()
+    cache: _SceneCache = {}
+    for device_id, entry in data.items():
+        if not isinstance(entry, list) or len(entry) != 2:
+            continue
+        expiry, scenes = entry
+        if (
+            isinstance(expiry, (int, float))
+            and not isinstance(expiry, bool)
+            and isinstance(scenes, list)
+            and expiry > now
+        ):
+            cache[device_id] = (float(expiry), scenes)
+    return cache
+
+
+async def _fetch_once(
+    inflight: dict[str, asyncio.Task[list[dict[str, Any]]]],
+    device_id: str,
+    fetch: Callable[[], Coroutine[Any, Any, list[dict[str, Any]]]],
+) -> list[dict[str, Any]]:
+    """Run fetch for a device, joining an identical request already in flight.
+
+    Concurrent cache misses for the same device share a single API call.
+    The shared task is shielded so one cancelled caller doesn't abort it
+    for the others.
+    """
+    task = inflight.get(device_id)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        inflight[device_id] = task
+        task.add_done_callback(partial(_fetch_done, inflight, device_id))
+    return await asyncio.shield(task)
+
+
+def _fetch_done(
+    inflight: dict[str, asyncio.Task[list[dict[str, Any]]]],
+    device_id: str,
+    task: asyncio.Task[list[dict[str, Any]]],
+) -> None:
+    """Forget a finished fetch and retrieve its exception.
+
+    Waiters still receive the exception through the shield. Retrieving it
+    here keeps asyncio from logging it as never retrieved when every waiter
+    was cancelled first.
+    """
+    inflight.pop(device_id, None)
+    if not task.cancelled():
+        task.exception()
+
 
 class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
     """Coordinator for Govee device state management.
@@ -97,11 +271,19 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         # State cache
         self._states: dict[str, GoveeDeviceState] = {}
 
-        # Scene cache {device_id: [scenes]}
-        self._scene_cache: dict[str, list[dict[str, Any]]] = {}
+        # Scene cache {device_id: (expiry, [scenes])}
+        self._scene_cache: _SceneCache = {}
+
+        # DIY scene cache {device_id: (expiry, [scenes])}
+        self._diy_scene_cache: _SceneCache = {}
 
-        # DIY scene cache {device_id: [scenes]}
-        self._diy_scene_cache: dict[str, list[dict[str, Any]]] = {}
+        self._scene_store = _scene_store(hass, config_entry.entry_id)
+        # True while scene cache changes haven't been written to the store
+        self._scene_store_dirty = False
+
+        # In-flight scene fetches, shared by concurrent cache misses
+        self._scene_fetches: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+        self._diy_scene_fetches: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
 
         # Observers for state changes
         self._observers: list[IStateObserver] = []
@@ -113,9 +295,24 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         # Maps device_id -> MQTT topic for publishing commands
         self._device_topics: dict[str, str] = {}
 
+        # Latest send per device ID and command coalesce key, and the command
+        # queued behind a send already in flight
+        self._command_sends: dict[tuple[Any, ...], asyncio.Task[bool]] = {}
+        self._pending_commands: dict[tuple[Any, ...], DeviceCommand] = {}
+
         # Track rate limit state to avoid spamming repair issues
         self._rate_limited: bool = False
 
+        # Bounds concurrent REST requests fanned out by gather()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Devices whose state changed in the current listener update, so
+        # entities of unchanged devices can skip their state write. None
+        # means every device, which is the default for any update that
+        # doesn't go through _async_notify_devices or a successful poll.
+        self._last_changed_device_ids: frozenset[str] | None = None
+        self._mqtt_was_connected = False
+
     @property
     def devices(self) -> dict[str, GoveeDevice]:
         """Get all discovered devices."""
@@ -131,6 +328,11 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         """Get current states for all devices."""
         return self._states
 
+    @property
+    def last_changed_device_ids(self) -> frozenset[str] | None:
+        """Device IDs changed in the current listener update, None for all."""
+        return self._last_changed_device_ids
+
     def get_device(self, device_id: str) -> GoveeDevice | None:
         """Get device by ID."""
         return self._devices.get(device_id)
@@ -149,6 +351,20 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         if observer in self._observers:
             self._observers.remove(observer)
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, then reset the change set to every device."""
+        try:
+            super().async_update_listeners()
+        finally:
+            self._last_changed_device_ids = None
+
+    @callback
+    def _async_notify_devices(self, device_ids: Iterable[str]) -> None:
+        """Push current states to the entities of the given devices only."""
+        self._last_changed_device_ids = frozenset(device_ids)
+        self.async_set_updated_data(self._states)
+
     def _notify_observers(self, device_id: str, state: GoveeDeviceState) -> None:
         """Notify all observers of state change."""
         for observer in self._observers:
@@ -162,6 +378,9 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
 
         Should be called once during integration setup.
         """
+        # Restore scene lists cached before the last restart
+        await self._async_load_scenes()
+
         # Discover devices
         await self._discover_devices()
 
@@ -171,6 +390,38 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             # Fetch device-specific MQTT topics for publishing commands
             await self._fetch_device_topics()
 
+    async def _async_load_scenes(self) -> None:
+        """Load persisted scene caches, keeping entries that haven't expired."""
+        data = await self._scene_store.async_load()
+        if not isinstance(data, dict):
+            return
+        self._scene_cache = _load_scene_cache(data.get("dynamic"))
+        self._diy_scene_cache = _load_scene_cache(data.get("diy"))
+        _LOGGER.debug(
+            "Restored cached scenes for %d devices, DIY scenes for %d devices",
+            len(self._scene_cache),
+            len(self._diy_scene_cache),
+        )
+
+    def _scene_store_data(self) -> dict[str, Any]:
+        """Return the scene caches in their stored form."""
+        self._scene_store_dirty = False
+        return {"dynamic": self._scene_cache, "diy": self._diy_scene_cache}
+
+    def _cache_scenes(
+        self,
+        cache: _SceneCache,
+        device_id: str,
+        scenes: list[dict[str, Any]],
+        ttl: float = SCENE_CACHE_TTL,
+    ) -> None:
+        """Store scenes for a device, valid for ttl seconds, and persist them."""
+        cache[device_id] = (time.time() + ttl, scenes)
+        self._scene_store_dirty = True
+        self._scene_store.async_delay_save(
+            self._scene_store_data, SCENE_STORE_SAVE_DELAY
+        )
+
     async def _discover_devices(self) -> None:
         """Discover all devices from Govee API."""
         try:
@@ -182,22 +433,24 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 self._enable_groups,
             )
 
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
             for device in devices:
-                _LOGGER.debug(
-                    "Device: %s (%s) type=%s is_group=%s",
-                    device.name,
-                    device.device_id,
-                    device.device_type,
-                    device.is_group,
-                )
-                # Log capabilities for debugging segment issues
-                for cap in device.capabilities:
+                if debug:
                     _LOGGER.debug(
-                        "  Capability: type=%s instance=%s params=%s",
-                        cap.type,
-                        cap.instance,
-                        cap.parameters,
+                        "Device: %s (%s) type=%s is_group=%s",
+                        device.name,
+                        device.device_id,
+                        device.device_type,
+                        device.is_group,
                     )
+                    # Log capabilities for debugging segment issues
+                    for cap in device.capabilities:
+                        _LOGGER.debug(
+                            "  Capability: type=%s instance=%s params=%s",
+                            cap.type,
+                            cap.instance,
+                            cap.parameters,
+                        )
 
                 # Filter group devices unless enabled
                 if device.is_group and not self._enable_groups:
@@ -226,38 +479,12 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             _LOGGER.debug(
                 "Pre-populating scene cache for %d devices", len(self._devices)
             )
-            for device_id, device in self._devices.items():
-                if device.supports_scenes:
-                    try:
-                        scenes = await self._api_client.get_dynamic_scenes(
-                            device_id, device.sku
-                        )
-                        self._scene_cache[device_id] = scenes
-                        _LOGGER.debug(
-                            "Cached %d scenes for %s", len(scenes), device.name
-                        )
-                    except GoveeApiError as err:
-                        _LOGGER.warning(
-                            "Failed to pre-fetch scenes for %s: %s", device.name, err
-                        )
-                        self._scene_cache[device_id] = []
-
-                if device.supports_diy_scenes:
-                    try:
-                        diy_scenes = await self._api_client.get_diy_scenes(
-                            device_id, device.sku
-                        )
-                        self._diy_scene_cache[device_id] = diy_scenes
-                        _LOGGER.debug(
-                            "Cached %d DIY scenes for %s", len(diy_scenes), device.name
-                        )
-                    except GoveeApiError as err:
-                        _LOGGER.warning(
-                            "Failed to pre-fetch DIY scenes for %s: %s",
-                            device.name,
-                            err,
-                        )
-                        self._diy_scene_cache[device_id] = []
+            await asyncio.gather(
+                *(
+                    self._prefetch_scenes(device_id, device)
+                    for device_id, device in self._devices.items()
+                )
+            )
 
             # Clear any auth issues on success
             await async_delete_auth_issue(self.hass, self._config_entry)
@@ -269,6 +496,55 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         except GoveeApiError as err:
             raise UpdateFailed(f"Failed to discover devices: {err}") from err
 
+    async def _prefetch_scenes(self, device_id: str, device: GoveeDevice) -> None:
+        """Populate the scene caches for a single device.
+
+        Scenes restored from storage are reused until they expire. Failures
+        are logged and briefly cached as an empty list so discovery of the
+        remaining devices is not affected.
+
+        Args:
+            device_id: Device identifier.
+            device: Device instance.
+        """
+        if device.supports_scenes and not _is_fresh(self._scene_cache, device_id):
+            try:
+                async with self._request_semaphore:
+                    scenes = await self._api_client.get_dynamic_scenes(
+                        device_id, device.sku
+                    )
+                self._cache_scenes(self._scene_cache, device_id, scenes)
+                _LOGGER.debug("Cached %d scenes for %s", len(scenes), device.name)
+            except GoveeApiError as err:
+                _LOGGER.warning(
+                    "Failed to pre-fetch scenes for %s: %s", device.name, err
+                )
+                self._cache_scenes(
+                    self._scene_cache, device_id, [], SCENE_CACHE_ERROR_TTL
+                )
+
+        if device.supports_diy_scenes and not _is_fresh(
+            self._diy_scene_cache, device_id
+        ):
+            try:
+                async with self._request_semaphore:
+                    diy_scenes = await self._api_client.get_diy_scenes(
+                        device_id, device.sku
+                    )
+                self._cache_scenes(self._diy_scene_cache, device_id, diy_scenes)
+                _LOGGER.debug(
+                    "Cached %d DIY scenes for %s", len(diy_scenes), device.name
+                )
+            except GoveeApiError as err:
+                _LOGGER.warning(
+                    "Failed to pre-fetch DIY scenes for %s: %s",
+                    device.name,
+                    err,
+                )
+                self._cache_scenes(
+                    self._diy_scene_cache, device_id, [], SCENE_CACHE_ERROR_TTL
+                )
+
     async def _start_mqtt(self) -> None:
         """Start MQTT client for real-time updates."""
         if not self._iot_credentials:
@@ -340,7 +616,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         state.update_from_mqtt(state_data)
 
         # Update coordinator data and notify HA
-        self.async_set_updated_data(self._states)
+        self._async_notify_devices((device_id,))
 
         # Notify observers
         self._notify_observers(device_id, state)
@@ -356,7 +632,8 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
 
         Called by DataUpdateCoordinator on poll interval.
         """
-        if not self._devices:
+        if not self._devices or self._quota_exhausted():
+            self._last_changed_device_ids = frozenset()
             return self._states
 
         # Create tasks for parallel fetching
@@ -371,12 +648,18 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 results = await asyncio.gather(*tasks, return_exceptions=True)
         except TimeoutError:
             _LOGGER.warning("State fetch timed out after %ds", STATE_FETCH_TIMEOUT)
+            self._last_changed_device_ids = frozenset()
             return self._states
 
         # Process results
         successful_updates = 0
+        changed: set[str] = set()
         for device_id, result in zip(self._devices.keys(), results):
             if isinstance(result, GoveeDeviceState):
+                previous = self._states.get(device_id)
+                # Group states are updated in place, so always treat them as changed
+                if result is previous or result != previous:
+                    changed.add(device_id)
                 self._states[device_id] = result
                 successful_updates += 1
             elif isinstance(result, GoveeAuthError):
@@ -390,6 +673,13 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 )
                 # Keep previous state on error
 
+        # MQTT availability feeds entity availability for every device
+        mqtt_connected = self.mqtt_connected
+        if mqtt_connected != self._mqtt_was_connected:
+            self._mqtt_was_connected = mqtt_connected
+            changed.update(self._devices)
+        self._last_changed_device_ids = frozenset(changed)
+
         # Clear rate limit issue if we got successful updates
         if successful_updates > 0 and self._rate_limited:
             self._rate_limited = False
@@ -397,6 +687,39 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
 
         return self._states
 
+    def _quota_exhausted(self) -> bool:
+        """Return True if the remaining API quota can't cover a full poll.
+
+        Only trusted until the advertised reset time; with no reset time
+        known the poll goes ahead and refreshes the counters.
+        """
+        client = self._api_client
+        if time.time() >= client.rate_limit_reset:
+            return False
+
+        polled = sum(1 for device in self._devices.values() if not device.is_group)
+        if client.rate_limit_remaining >= polled:
+            return False
+
+        _LOGGER.info(
+            "Skipping state poll: %d API calls left for %d devices until reset",
+            client.rate_limit_remaining,
+            polled,
+        )
+        return True
+
+    def _group_state(self, device_id: str) -> GoveeDeviceState:
+        """Return the existing (optimistic) state for an unqueryable device.
+
+        Group devices are always considered online since they can be
+        controlled even though their state can't be read.
+        """
+        existing = self._states.get(device_id)
+        if existing is None:
+            return GoveeDeviceState.create_empty(device_id)
+        existing.online = True
+        return existing
+
     async def _fetch_device_state(
         self,
         device_id: str,
@@ -413,58 +736,28 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         """
         # Skip API call for group devices - state fetch always fails with 400
         if device.is_group:
-            existing = self._states.get(device_id)
-            if existing:
-                existing.online = True  # Group devices are always "available"
-                return existing
-            return GoveeDeviceState.create_empty(device_id)
+            return self._group_state(device_id)
 
         try:
-            state = await self._api_client.get_device_state(device_id, device.sku)
+            async with self._request_semaphore:
+                state = await self._api_client.get_device_state(
+                    device_id, device.sku
+                )
 
-            # Preserve optimistic state for scenes (API doesn't return active scene)
-            # But clear scene if device was turned off
+            # Preserve optimistic state the API doesn't report (scenes, modes)
+            # while the device stays on; clear it once the device is off
             existing_state = self._states.get(device_id)
-            if existing_state and existing_state.active_scene:
-                if state.power_state:
-                    # Device is still on, preserve the scene
-                    state.active_scene = existing_state.active_scene
-                else:
-                    # Device is off, clear the scene
-                    _LOGGER.debug(
-                        "Clearing scene for %s (device turned off)", device_id
-                    )
-
-            # Preserve DreamView optimistic state
-            # API often returns stale data that doesn't reflect recent commands
-            if existing_state and existing_state.dreamview_enabled:
-                if state.power_state:
-                    state.dreamview_enabled = existing_state.dreamview_enabled
-                else:
-                    _LOGGER.debug(
-                        "Clearing DreamView for %s (device turned off)", device_id
-                    )
-
-            # Preserve Music Mode optimistic state
-            if existing_state and existing_state.music_mode_enabled:
-                if state.power_state:
-                    state.music_mode_enabled = existing_state.music_mode_enabled
-                    state.music_mode_value = existing_state.music_mode_value
-                    state.music_mode_name = existing_state.music_mode_name
-                    state.music_sensitivity = existing_state.music_sensitivity
-                else:
-                    _LOGGER.debug(
-                        "Clearing music mode for %s (device turned off)", device_id
-                    )
-
-            # Preserve DIY scene optimistic state
-            if existing_state and existing_state.active_diy_scene:
-                if state.power_state:
-                    state.active_diy_scene = existing_state.active_diy_scene
-                else:
-                    _LOGGER.debug(
-                        "Clearing DIY scene for %s (device turned off)", device_id
-                    )
+            if existing_state is not None:
+                for flag, fields, label in _PRESERVED_OPTIMISTIC_STATE:
+                    if not getattr(existing_state, flag):
+                        continue
+                    if state.power_state:
+                        for name in fields:
+                            setattr(state, name, getattr(existing_state, name))
+                    else:
+                        _LOGGER.debug(
+                            "Clearing %s for %s (device turned off)", label, device_id
+                        )
 
             return state
 
@@ -473,11 +766,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             _LOGGER.debug(
                 "State query failed for group device %s [expected]", device_id
             )
-            existing = self._states.get(device_id)
-            if existing:
-                existing.online = True  # Group devices are always "available"
-                return existing
-            return GoveeDeviceState.create_empty(device_id)
+            return self._group_state(device_id)
 
         except GoveeRateLimitError as err:
             _LOGGER.warning("Rate limit hit, keeping previous state")
@@ -507,6 +796,11 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
     ) -> bool:
         """Send control command to device with optimistic update.
 
+        A command is sent right away unless one for the same device capability
+        is still in flight. Commands arriving meanwhile are coalesced: only the
+        latest is sent once the in-flight one finishes, and every caller
+        receives its result.
+
         Args:
             device_id: Device identifier.
             command: Command to execute.
@@ -519,6 +813,53 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             _LOGGER.error("Unknown device: %s", device_id)
             return False
 
+        key = (device_id, *command.coalesce_key)
+        task = self._command_sends.get(key)
+        if task is not None and not task.done() and key in self._pending_commands:
+            # That send is still waiting for its command: replace it and join
+            self._pending_commands[key] = command
+            return await asyncio.shield(task)
+
+        # Start a new send, queued behind the one in flight (if any)
+        self._pending_commands[key] = command
+        task = self.hass.async_create_task(
+            self._async_send_pending(device, key, task),
+            f"{DOMAIN} command {device_id}",
+        )
+        self._command_sends[key] = task
+        task.add_done_callback(partial(self._command_send_done, key))
+        return await asyncio.shield(task)
+
+    def _command_send_done(
+        self, key: tuple[Any, ...], task: asyncio.Task[bool]
+    ) -> None:
+        """Forget a finished send, and its command if it never went out."""
+        if self._command_sends.get(key) is task:
+            del self._command_sends[key]
+            self._pending_commands.pop(key, None)
+
+    async def _async_send_pending(
+        self,
+        device: GoveeDevice,
+        key: tuple[Any, ...],
+        previous: asyncio.Task[bool] | None,
+    ) -> bool:
+        """Send the latest command queued under key once previous finishes.
+
+        Args:
+            device: Device to control.
+            key: Coalescing key of the queued command.
+            previous: Send for the same key still in flight, if any.
+
+        Returns:
+            True if command succeeded.
+        """
+        if previous is not None:
+            await asyncio.wait((previous,))
+        # Commands arriving from here on queue behind this send
+        command = self._pending_commands.pop(key)
+        device_id = device.device_id
+
         try:
             success = await self._api_client.control_device(
                 device_id,
@@ -526,10 +867,10 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 command,
             )
 
-            if success:
-                # Apply optimistic update
-                self._apply_optimistic_update(device_id, command)
-                self.async_set_updated_data(self._states)
+            # Apply optimistic update, skipping the listener round when the
+            # device was already in the commanded state
+            if success and self._apply_optimistic_update(device_id, command):
+                self._async_notify_devices((device_id,))
 
             return success
 
@@ -591,6 +932,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             state = self._states.get(device_id)
             if state:
                 state.apply_optimistic_music_mode(enabled)
+                self._async_notify_devices((device_id,))
             _LOGGER.debug(
                 "Sent music mode %s (sensitivity=%d) to %s",
                 "ON" if enabled else "OFF",
@@ -646,6 +988,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             state = self._states.get(device_id)
             if state:
                 state.apply_optimistic_dreamview(enabled)
+                self._async_notify_devices((device_id,))
             _LOGGER.debug(
                 "Sent DreamView %s to %s via BLE passthrough",
                 "ON" if enabled else "OFF",
@@ -687,6 +1030,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         state = self._states.get(device_id)
         if state:
             state.apply_optimistic_diy_style(style, style_value)
+            self._async_notify_devices((device_id,))
 
         _LOGGER.debug(
             "Applied DIY style '%s' (value=%d) to %s (optimistic only)",
@@ -701,42 +1045,19 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         self,
         device_id: str,
         command: DeviceCommand,
-    ) -> None:
-        """Apply optimistic state update based on command."""
+    ) -> bool:
+        """Apply optimistic state update based on command.
+
+        Returns:
+            True if the update changed the device's state.
+        """
         state = self._states.get(device_id)
         if not state:
-            return
+            return False
 
-        # Import here to avoid circular dependency
-        from .models.commands import (
-            BrightnessCommand,
-            ColorCommand,
-            ColorTempCommand,
-            DIYSceneCommand,
-            ModeCommand,
-            MusicModeCommand,
-            PowerCommand,
-            SceneCommand,
-            ToggleCommand,
-        )
-        from .models.device import INSTANCE_DREAMVIEW, INSTANCE_HDMI_SOURCE
-
-        if isinstance(command, PowerCommand):
-            state.apply_optimistic_power(command.power_on)
-        elif isinstance(command, BrightnessCommand):
-            state.apply_optimistic_brightness(command.brightness)
-        elif isinstance(command, ColorCommand):
-            state.apply_optimistic_color(command.color)
-        elif isinstance(command, ColorTempCommand):
-            state.apply_optimistic_color_temp(command.kelvin)
-        elif isinstance(command, SceneCommand):
-            state.apply_optimistic_scene(str(command.scene_id))
-        elif isinstance(command, DIYSceneCommand):
-            state.apply_optimistic_diy_scene(str(command.scene_id))
-        elif isinstance(command, ModeCommand):
-            if command.mode_instance == INSTANCE_HDMI_SOURCE:
-                state.apply_optimistic_hdmi_source(command.value)
-        elif isinstance(command, MusicModeCommand):
+        before = replace(state)
+
+        if isinstance(command, MusicModeCommand):
             # Look up mode name from device capabilities for display
             device = self._devices.get(device_id)
             mode_name = None
@@ -750,10 +1071,14 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 command.sensitivity,
                 mode_name,
             )
-        elif isinstance(command, ToggleCommand):
-            # Handle toggle commands (DreamView, night light, etc)
-            if command.toggle_instance == INSTANCE_DREAMVIEW:
-                state.apply_optimistic_dreamview(command.enabled)
+        else:
+            handler = _OPTIMISTIC_HANDLERS.get(type(command))
+            if handler is not None:
+                handler(state, command)
+
+        # Only the reported values matter, not which path last wrote them
+        before.source = state.source
+        return state != before
 
     async def async_get_scenes(
         self,
@@ -769,8 +1094,9 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         Returns:
             List of scene definitions.
         """
-        if not refresh and device_id in self._scene_cache:
-            cached_scenes = self._scene_cache[device_id]
+        entry = self._scene_cache.get(device_id)
+        if not refresh and _is_fresh(self._scene_cache, device_id):
+            cached_scenes = self._scene_cache[device_id][1]
             _LOGGER.debug(
                 "Returning %d cached scenes for %s",
                 len(cached_scenes),
@@ -792,8 +1118,12 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         )
 
         try:
-            scenes = await self._api_client.get_dynamic_scenes(device_id, device.sku)
-            self._scene_cache[device_id] = scenes
+            scenes = await _fetch_once(
+                self._scene_fetches,
+                device_id,
+                partial(self._api_client.get_dynamic_scenes, device_id, device.sku),
+            )
+            self._cache_scenes(self._scene_cache, device_id, scenes)
             _LOGGER.info(
                 "Fetched and cached %d scenes for %s",
                 len(scenes),
@@ -806,8 +1136,11 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 device.name,
                 err,
             )
-            # Return cached scenes if available, otherwise empty list
-            cached = self._scene_cache.get(device_id, [])
+            # Keep serving cached scenes (or none) and retry after a back-off
+            cached = entry[1] if entry is not None else []
+            self._cache_scenes(
+                self._scene_cache, device_id, cached, SCENE_CACHE_ERROR_TTL
+            )
             _LOGGER.debug("Returning %d cached scenes after error", len(cached))
             return cached
 
@@ -825,8 +1158,9 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         Returns:
             List of DIY scene definitions.
         """
-        if not refresh and device_id in self._diy_scene_cache:
-            cached_scenes = self._diy_scene_cache[device_id]
+        entry = self._diy_scene_cache.get(device_id)
+        if not refresh and _is_fresh(self._diy_scene_cache, device_id):
+            cached_scenes = self._diy_scene_cache[device_id][1]
             _LOGGER.debug(
                 "Returning %d cached DIY scenes for %s",
                 len(cached_scenes),
@@ -848,8 +1182,12 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         )
 
         try:
-            scenes = await self._api_client.get_diy_scenes(device_id, device.sku)
-            self._diy_scene_cache[device_id] = scenes
+            scenes = await _fetch_once(
+                self._diy_scene_fetches,
+                device_id,
+                partial(self._api_client.get_diy_scenes, device_id, device.sku),
+            )
+            self._cache_scenes(self._diy_scene_cache, device_id, scenes)
             _LOGGER.info(
                 "Fetched and cached %d DIY scenes for %s",
                 len(scenes),
@@ -862,15 +1200,29 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 device.name,
                 err,
             )
-            # Return cached scenes if available, otherwise empty list
-            cached = self._diy_scene_cache.get(device_id, [])
+            # Keep serving cached scenes (or none) and retry after a back-off
+            cached = entry[1] if entry is not None else []
+            self._cache_scenes(
+                self._diy_scene_cache, device_id, cached, SCENE_CACHE_ERROR_TTL
+            )
             _LOGGER.debug("Returning %d cached DIY scenes after error", len(cached))
             return cached
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and cleanup resources."""
-        if self._mqtt_client:
-            await self._mqtt_client.async_stop()
-            self._mqtt_client = None
+        # Abandon queued commands before the API client is closed
+        sends = list(self._command_sends.values())
+        for task in sends:
+            task.cancel()
+        await asyncio.gather(*sends, return_exceptions=True)
 
-        await self._api_client.close()
+        try:
+            # Flush a pending delayed write of the scene caches
+            if self._scene_store_dirty:
+                await self._scene_store.async_save(self._scene_store_data())
+        finally:
+            if self._mqtt_client:
+                await self._mqtt_client.async_stop()
+                self._mqtt_client = None
+
+            await self._api_client.close()
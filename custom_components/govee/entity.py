@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -80,6 +81,13 @@ class GoveeEntity(CoordinatorEntity["GoveeCoordinator"]):
         """Get current device state from coordinator."""
         return self.coordinator.get_state(self._device_id)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's device changed."""
+        changed = self.coordinator.last_changed_device_ids
+        if changed is None or self._device_id in changed:
+            super()._handle_coordinator_update()
+
     @staticmethod
     def _infer_area_from_name(name: str) -> str | None:
         """Infer area from device name.
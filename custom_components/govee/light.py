@@ -246,6 +246,10 @@ class GoveeLightEntity(GoveeEntity, LightEntity, RestoreEntity):
             PowerCommand(power_on=True),
         )
 
+        # The coordinator skips listener updates when the device state didn't
+        # change (e.g. already on), so write the new color mode here
+        self.async_write_ha_state()
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
         await self.coordinator.async_control_device(
@@ -61,6 +61,11 @@ class DeviceCommand(ABC):
         """Get the value to send to the API."""
         ...
 
+    @property
+    def coalesce_key(self) -> tuple[Any, ...]:
+        """Get the key under which a later command supersedes this one."""
+        return (self.capability_type, self.instance)
+
     def to_api_payload(self) -> dict[str, Any]:
         """Convert to Govee API command payload.
 
@@ -203,6 +208,11 @@ class SegmentColorCommand(DeviceCommand):
     def instance(self) -> str:
         return INSTANCE_SEGMENT_COLOR
 
+    @property
+    def coalesce_key(self) -> tuple[Any, ...]:
+        # Only commands for the same segments replace each other
+        return (self.capability_type, self.instance, self.segment_indices)
+
     def get_value(self) -> dict[str, Any]:
         return {
             "segment": list(self.segment_indices),
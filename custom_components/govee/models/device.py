@@ -6,7 +6,9 @@ Frozen dataclass for immutability - device properties don't change at runtime.
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
@@ -106,7 +108,7 @@ class SegmentCapability:
         return cls(segment_count=count) if count else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoveeCapability:
     """Represents a device capability from Govee API."""
 
@@ -231,7 +233,8 @@ class GoveeCapability:
 class GoveeDevice:
     """Represents a Govee device with its static properties.
 
-    Frozen for immutability - device capabilities don't change at runtime.
+    Frozen for immutability - device capabilities don't change at runtime,
+    so properties that still scan capabilities are cached per instance.
     """
 
     device_id: str
@@ -241,37 +244,55 @@ class GoveeDevice:
     capabilities: tuple[GoveeCapability, ...] = field(default_factory=tuple)
     is_group: bool = False
 
+    # Lookup indexes derived from capabilities, filled in __post_init__
+    _capability_index: dict[tuple[str, str], GoveeCapability] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _capability_types: set[str] = field(
+        init=False, repr=False, compare=False, default_factory=set
+    )
+
+    def __post_init__(self) -> None:
+        """Index capabilities by (type, instance) and by type."""
+        for cap in self.capabilities:
+            # First match wins, as with a linear scan
+            self._capability_index.setdefault((cap.type, cap.instance), cap)
+            self._capability_types.add(cap.type)
+
+    def _has(self, cap_type: str, instance: str) -> bool:
+        return (cap_type, instance) in self._capability_index
+
     @property
     def supports_power(self) -> bool:
         """Check if device supports on/off control."""
-        return any(cap.is_power for cap in self.capabilities)
+        return self._has(CAPABILITY_ON_OFF, INSTANCE_POWER)
 
     @property
     def supports_brightness(self) -> bool:
         """Check if device supports brightness control."""
-        return any(cap.is_brightness for cap in self.capabilities)
+        return self._has(CAPABILITY_RANGE, INSTANCE_BRIGHTNESS)
 
     @property
     def supports_rgb(self) -> bool:
         """Check if device supports RGB color."""
-        return any(cap.is_color_rgb for cap in self.capabilities)
+        return self._has(CAPABILITY_COLOR_SETTING, INSTANCE_COLOR_RGB)
 
     @property
     def supports_color_temp(self) -> bool:
         """Check if device supports color temperature."""
-        return any(cap.is_color_temp for cap in self.capabilities)
+        return self._has(CAPABILITY_COLOR_SETTING, INSTANCE_COLOR_TEMP)
 
     @property
     def supports_segments(self) -> bool:
         """Check if device supports segment control (RGBIC)."""
-        return any(cap.is_segment_color for cap in self.capabilities)
+        return CAPABILITY_SEGMENT_COLOR in self._capability_types
 
-    @property
+    @cached_property
     def supports_scenes(self) -> bool:
         """Check if device supports dynamic scenes."""
         return any(cap.is_scene for cap in self.capabilities)
 
-    @property
+    @cached_property
     def supports_diy_scenes(self) -> bool:
         """Check if device supports DIY scenes."""
         return any(cap.is_diy_scene for cap in self.capabilities)
@@ -279,9 +300,9 @@ class GoveeDevice:
     @property
     def supports_night_light(self) -> bool:
         """Check if device supports night light toggle."""
-        return any(cap.is_night_light for cap in self.capabilities)
+        return self._has(CAPABILITY_TOGGLE, INSTANCE_NIGHT_LIGHT)
 
-    @property
+    @cached_property
     def supports_music_mode(self) -> bool:
         """Check if device supports music mode.
 
@@ -290,7 +311,7 @@ class GoveeDevice:
         - DIY scene support (which includes music reactive options)
         """
         return (
-            any(cap.type == CAPABILITY_MUSIC_MODE for cap in self.capabilities)
+            CAPABILITY_MUSIC_MODE in self._capability_types
             or self.supports_diy_scenes
         )
 
@@ -307,30 +328,30 @@ class GoveeDevice:
     @property
     def supports_oscillation(self) -> bool:
         """Check if device supports oscillation (fans)."""
-        return any(cap.is_oscillation for cap in self.capabilities)
+        return self._has(CAPABILITY_TOGGLE, INSTANCE_OSCILLATION)
 
     @property
     def supports_dreamview(self) -> bool:
         """Check if device supports DreamView (Movie Mode) toggle."""
-        return any(cap.is_dreamview for cap in self.capabilities)
+        return self._has(CAPABILITY_TOGGLE, INSTANCE_DREAMVIEW)
 
     @property
     def supports_work_mode(self) -> bool:
         """Check if device supports work mode (fans)."""
-        return any(cap.is_work_mode for cap in self.capabilities)
+        return self._has(CAPABILITY_WORK_MODE, INSTANCE_WORK_MODE)
 
     @property
     def supports_hdmi_source(self) -> bool:
         """Check if device supports HDMI source selection."""
-        return any(cap.is_hdmi_source for cap in self.capabilities)
+        return self._has(CAPABILITY_MODE, INSTANCE_HDMI_SOURCE)
 
     def get_hdmi_source_options(self) -> list[dict[str, Any]]:
         """Get available HDMI source options from capability parameters."""
-        for cap in self.capabilities:
-            if cap.is_hdmi_source:
-                options: list[dict[str, Any]] = cap.parameters.get("options", [])
-                return options
-        return []
+        cap = self.get_capability(CAPABILITY_MODE, INSTANCE_HDMI_SOURCE)
+        if cap is None:
+            return []
+        options: list[dict[str, Any]] = cap.parameters.get("options", [])
+        return options
 
     @property
     def has_struct_music_mode(self) -> bool:
@@ -340,14 +361,9 @@ class GoveeDevice:
         containing musicMode, sensitivity, and optionally autoColor/rgb fields.
         Legacy devices use BLE passthrough via MQTT.
         """
-        for cap in self.capabilities:
-            if (
-                cap.type == CAPABILITY_MUSIC_MODE
-                and cap.instance == INSTANCE_MUSIC_MODE
-            ):
-                # STRUCT capabilities have 'fields' array in parameters
-                return "fields" in cap.parameters
-        return False
+        cap = self.get_capability(CAPABILITY_MUSIC_MODE, INSTANCE_MUSIC_MODE)
+        # STRUCT capabilities have 'fields' array in parameters
+        return cap is not None and "fields" in cap.parameters
 
     def get_music_mode_options(self) -> list[dict[str, Any]]:
         """Extract music mode options from capability fields.
@@ -355,15 +371,12 @@ class GoveeDevice:
         Returns list of {"name": "Rhythm", "value": 1} dicts.
         Pattern validated in external repositories.
         """
-        for cap in self.capabilities:
-            if (
-                cap.type == CAPABILITY_MUSIC_MODE
-                and cap.instance == INSTANCE_MUSIC_MODE
-            ):
-                for f in cap.parameters.get("fields", []):
-                    if f.get("fieldName") == "musicMode":
-                        options: list[dict[str, Any]] = f.get("options", [])
-                        return options
+        cap = self.get_capability(CAPABILITY_MUSIC_MODE, INSTANCE_MUSIC_MODE)
+        if cap is not None:
+            for f in cap.parameters.get("fields", []):
+                if f.get("fieldName") == "musicMode":
+                    options: list[dict[str, Any]] = f.get("options", [])
+                    return options
         return []
 
     def get_music_sensitivity_range(self) -> tuple[int, int]:
@@ -371,15 +384,12 @@ class GoveeDevice:
 
         Returns (min, max) tuple, defaulting to (0, 100).
         """
-        for cap in self.capabilities:
-            if (
-                cap.type == CAPABILITY_MUSIC_MODE
-                and cap.instance == INSTANCE_MUSIC_MODE
-            ):
-                for f in cap.parameters.get("fields", []):
-                    if f.get("fieldName") == "sensitivity":
-                        range_info = f.get("range", {})
-                        return (range_info.get("min", 0), range_info.get("max", 100))
+        cap = self.get_capability(CAPABILITY_MUSIC_MODE, INSTANCE_MUSIC_MODE)
+        if cap is not None:
+            for f in cap.parameters.get("fields", []):
+                if f.get("fieldName") == "sensitivity":
+                    range_info = f.get("range", {})
+                    return (range_info.get("min", 0), range_info.get("max", 100))
         return (0, 100)
 
     @property
@@ -396,20 +406,18 @@ class GoveeDevice:
     @property
     def brightness_range(self) -> tuple[int, int]:
         """Get brightness range from capability. Default (0, 100)."""
-        for cap in self.capabilities:
-            if cap.is_brightness:
-                return cap.brightness_range
-        return (0, 100)
+        cap = self.get_capability(CAPABILITY_RANGE, INSTANCE_BRIGHTNESS)
+        return cap.brightness_range if cap is not None else (0, 100)
 
-    @property
+    @cached_property
     def color_temp_range(self) -> ColorTempRange | None:
         """Get color temperature range if supported."""
-        for cap in self.capabilities:
-            if cap.is_color_temp:
-                return ColorTempRange.from_capability({"parameters": cap.parameters})
-        return None
+        cap = self.get_capability(CAPABILITY_COLOR_SETTING, INSTANCE_COLOR_TEMP)
+        if cap is None:
+            return None
+        return ColorTempRange.from_capability({"parameters": cap.parameters})
 
-    @property
+    @cached_property
     def segment_count(self) -> int:
         """Get number of segments for RGBIC devices."""
         for cap in self.capabilities:
@@ -420,15 +428,16 @@ class GoveeDevice:
 
     def get_capability(self, cap_type: str, instance: str) -> GoveeCapability | None:
         """Get a specific capability by type and instance."""
-        for cap in self.capabilities:
-            if cap.type == cap_type and cap.instance == instance:
-                return cap
-        return None
+        return self._capability_index.get((cap_type, instance))
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> GoveeDevice:
         """Create GoveeDevice from API response data.
 
+        SKU, device type and capability type/instance strings are interned:
+        they repeat across every device of an account, so all devices share
+        one copy of each and index lookups compare by identity first.
+
         Args:
             data: Device dict from /user/devices endpoint.
 
@@ -436,9 +445,9 @@ class GoveeDevice:
             GoveeDevice instance.
         """
         device_id = data.get("device", "")
-        sku = data.get("sku", "")
+        sku = sys.intern(data.get("sku") or "")
         name = data.get("deviceName", sku)
-        device_type = data.get("type", "devices.types.light")
+        device_type = sys.intern(data.get("type") or DEVICE_TYPE_LIGHT)
 
         # Check for group device types
         # Groups can be identified by:
@@ -450,22 +459,21 @@ class GoveeDevice:
             "devices.types.scenic_group",
         ) or (device_id.isdigit())
 
-        # Parse capabilities
-        raw_caps = data.get("capabilities", [])
-        capabilities = []
-        for raw_cap in raw_caps:
-            cap = GoveeCapability(
-                type=raw_cap.get("type", ""),
-                instance=raw_cap.get("instance", ""),
-                parameters=raw_cap.get("parameters", {}),
+        # Parse capabilities (the API may send null for devices without any)
+        capabilities = tuple(
+            GoveeCapability(
+                type=sys.intern(raw_cap.get("type") or ""),
+                instance=sys.intern(raw_cap.get("instance") or ""),
+                parameters=raw_cap.get("parameters") or {},
             )
-            capabilities.append(cap)
+            for raw_cap in data.get("capabilities") or ()
+        )
 
         return cls(
             device_id=device_id,
             sku=sku,
             name=name,
             device_type=device_type,
-            capabilities=tuple(capabilities),
+            capabilities=capabilities,
             is_group=is_group,
         )
@@ -5,11 +5,13 @@ Mutable state that changes with device updates from API or MQTT.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RGBColor:
     """Immutable RGB color representation."""
 
@@ -36,11 +38,12 @@ class RGBColor:
 
     @classmethod
     def from_packed_int(cls, value: int) -> RGBColor:
-        """Create from Govee API packed integer."""
-        r = (value >> 16) & 0xFF
-        g = (value >> 8) & 0xFF
-        b = value & 0xFF
-        return cls(r=r, g=g, b=b)
+        """Create from Govee API packed integer.
+
+        Instances are immutable, so decoded colors are shared: polling reports
+        the same value for a device on every refresh.
+        """
+        return _rgb_from_packed_int(value)
 
     @classmethod
     def from_dict(cls, data: dict[str, int]) -> RGBColor:
@@ -52,7 +55,13 @@ class RGBColor:
         )
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=256)
+def _rgb_from_packed_int(value: int) -> RGBColor:
+    """Decode a packed integer into a cached RGBColor."""
+    return RGBColor(r=(value >> 16) & 0xFF, g=(value >> 8) & 0xFF, b=value & 0xFF)
+
+
+@dataclass(frozen=True, slots=True)
 class SegmentState:
     """State of a single segment in RGBIC device."""
 
@@ -68,12 +77,13 @@ class SegmentState:
         return cls(index=index, color=color, brightness=brightness)
 
 
-@dataclass
+@dataclass(slots=True)
 class GoveeDeviceState:
     """Mutable device state updated from API or MQTT.
 
     Unlike GoveeDevice (frozen), state changes frequently and needs
-    to be updated in-place for performance.
+    to be updated in-place for performance. Slotted to keep per-device
+    instances small and attribute access fast on every poll.
     """
 
     device_id: str
@@ -118,47 +128,14 @@ class GoveeDeviceState:
         self.source = "api"
 
         # Parse capabilities array for state values
-        capabilities = data.get("capabilities", [])
-        for cap in capabilities:
+        handlers = _API_STATE_HANDLERS
+        for cap in data.get("capabilities", []):
             cap_type = cap.get("type", "")
-            instance = cap.get("instance", "")
-            state = cap.get("state", {})
-            value = state.get("value")
-
-            if cap_type == "devices.capabilities.online":
-                self.online = bool(value)
-
-            elif cap_type == "devices.capabilities.on_off":
-                if instance == "powerSwitch":
-                    self.power_state = bool(value)
-
-            elif cap_type == "devices.capabilities.range":
-                if instance == "brightness":
-                    self.brightness = int(value) if value is not None else 100
-
-            elif cap_type == "devices.capabilities.color_setting":
-                if instance == "colorRgb":
-                    if isinstance(value, int):
-                        self.color = RGBColor.from_packed_int(value)
-                    elif isinstance(value, dict):
-                        self.color = RGBColor.from_dict(value)
-                elif instance == "colorTemperatureK":
-                    self.color_temp_kelvin = int(value) if value is not None else None
-
-            elif cap_type == "devices.capabilities.toggle":
-                if instance == "oscillationToggle":
-                    self.oscillating = bool(value)
-                elif instance == "dreamViewToggle":
-                    self.dreamview_enabled = bool(value)
-
-            elif cap_type == "devices.capabilities.work_mode":
-                if instance == "workMode" and isinstance(value, dict):
-                    self.work_mode = value.get("workMode")
-                    self.mode_value = value.get("modeValue")
-
-            elif cap_type == "devices.capabilities.mode":
-                if instance == "hdmiSource":
-                    self.hdmi_source = int(value) if value is not None else None
+            handler = handlers.get((cap_type, cap.get("instance", "")))
+            if handler is None:
+                handler = handlers.get((cap_type, None))
+            if handler is not None:
+                handler(self, cap.get("state", {}).get("value"))
 
     def update_from_mqtt(self, data: dict[str, Any]) -> None:
         """Update state from MQTT push message.
@@ -331,3 +308,61 @@ class GoveeDeviceState:
     def create_empty(cls, device_id: str) -> GoveeDeviceState:
         """Create empty state for a device."""
         return cls(device_id=device_id)
+
+
+def _api_online(state: GoveeDeviceState, value: Any) -> None:
+    state.online = bool(value)
+
+
+def _api_power(state: GoveeDeviceState, value: Any) -> None:
+    state.power_state = bool(value)
+
+
+def _api_brightness(state: GoveeDeviceState, value: Any) -> None:
+    state.brightness = int(value) if value is not None else 100
+
+
+def _api_color_rgb(state: GoveeDeviceState, value: Any) -> None:
+    if isinstance(value, int):
+        state.color = RGBColor.from_packed_int(value)
+    elif isinstance(value, dict):
+        state.color = RGBColor.from_dict(value)
+
+
+def _api_color_temp(state: GoveeDeviceState, value: Any) -> None:
+    state.color_temp_kelvin = int(value) if value is not None else None
+
+
+def _api_oscillation(state: GoveeDeviceState, value: Any) -> None:
+    state.oscillating = bool(value)
+
+
+def _api_dreamview(state: GoveeDeviceState, value: Any) -> None:
+    state.dreamview_enabled = bool(value)
+
+
+def _api_work_mode(state: GoveeDeviceState, value: Any) -> None:
+    if isinstance(value, dict):
+        state.work_mode = value.get("workMode")
+        state.mode_value = value.get("modeValue")
+
+
+def _api_hdmi_source(state: GoveeDeviceState, value: Any) -> None:
+    state.hdmi_source = int(value) if value is not None else None
+
+
+# (capability type, instance) -> handler applying a REST state value.
+# An instance of None matches every instance of that capability type.
+_API_STATE_HANDLERS: dict[
+    tuple[str, str | None], Callable[[GoveeDeviceState, Any], None]
+] = {
+    ("devices.capabilities.online", None): _api_online,
+    ("devices.capabilities.on_off", "powerSwitch"): _api_power,
+    ("devices.capabilities.range", "brightness"): _api_brightness,
+    ("devices.capabilities.color_setting", "colorRgb"): _api_color_rgb,
+    ("devices.capabilities.color_setting", "colorTemperatureK"): _api_color_temp,
+    ("devices.capabilities.toggle", "oscillationToggle"): _api_oscillation,
+    ("devices.capabilities.toggle", "dreamViewToggle"): _api_dreamview,
+    ("devices.capabilities.work_mode", "workMode"): _api_work_mode,
+    ("devices.capabilities.mode", "hdmiSource"): _api_hdmi_source,
+}
@@ -2,16 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock
 
 import pytest
 
-from custom_components.govee.api import (
-    GoveeApiClient,
-    GoveeIotCredentials,
-)
 from custom_components.govee.models import (
     GoveeCapability,
     GoveeDevice,
@@ -38,15 +35,198 @@ from custom_components.govee.models.device import (
     INSTANCE_WORK_MODE,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.govee.api import GoveeIotCredentials
+    from custom_components.govee.coordinator import GoveeCoordinator
+
 # Capability constants for test devices
 DEVICE_TYPE_LIGHT = "devices.types.light"
 DEVICE_TYPE_PLUG = "devices.types.socket"
 DEVICE_TYPE_FAN = "devices.types.fan"
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark tests that run a Home Assistant instance as integration, others unit.
+
+    `pytest -m unit` then selects the fast subset that never boots hass.
+    """
+    for item in items:
+        fixturenames = getattr(item, "fixturenames", ())
+        marker = "integration" if "hass" in fixturenames else "unit"
+        item.add_marker(marker)
+
+
+def _cap(
+    type_: str, instance: str, parameters: dict[str, Any] | None = None
+) -> GoveeCapability:
+    """Build a capability, with no parameters unless given."""
+    return GoveeCapability(type=type_, instance=instance, parameters=parameters or {})
+
+
+# Read-only API payloads shared by every test. Fixtures hand out these
+# constants directly; copy.deepcopy() one if a test needs to mutate it.
+_API_DEVICE_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "device": "AA:BB:CC:DD:EE:FF:00:11",
+        "sku": "H6072",
+        "deviceName": "Living Room Light",
+        "type": "devices.types.light",
+        "capabilities": (
+            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": {}},
+            {
+                "type": CAPABILITY_RANGE,
+                "instance": INSTANCE_BRIGHTNESS,
+                "parameters": {"range": {"min": 0, "max": 100}},
+            },
+            {"type": CAPABILITY_COLOR_SETTING, "instance": INSTANCE_COLOR_RGB, "parameters": {}},
+        ),
+    }
+)
+
+_API_STATE_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "capabilities": (
+            {
+                "type": "devices.capabilities.online",
+                "instance": "online",
+                "state": {"value": True},
+            },
+            {
+                "type": CAPABILITY_ON_OFF,
+                "instance": INSTANCE_POWER,
+                "state": {"value": 1},
+            },
+            {
+                "type": CAPABILITY_RANGE,
+                "instance": INSTANCE_BRIGHTNESS,
+                "state": {"value": 75},
+            },
+            {
+                "type": CAPABILITY_COLOR_SETTING,
+                "instance": INSTANCE_COLOR_RGB,
+                "state": {"value": 16744512},  # RGB(255, 128, 64)
+            },
+        ),
+    }
+)
+
+_MQTT_STATE_MESSAGE: Mapping[str, Any] = MappingProxyType(
+    {
+        "device": "AA:BB:CC:DD:EE:FF:00:11",
+        "sku": "H6072",
+        "state": {
+            "onOff": 1,
+            "brightness": 75,
+            "color": {"r": 255, "g": 128, "b": 64},
+            "colorTemInKelvin": 0,
+        },
+    }
+)
+
+_API_FAN_DEVICE_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "device": "AA:BB:CC:DD:EE:FF:00:44",
+        "sku": "H7101",
+        "deviceName": "Living Room Fan",
+        "type": "devices.types.fan",
+        "capabilities": (
+            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": {}},
+            {"type": CAPABILITY_TOGGLE, "instance": INSTANCE_OSCILLATION, "parameters": {}},
+            {
+                "type": CAPABILITY_WORK_MODE,
+                "instance": INSTANCE_WORK_MODE,
+                "parameters": {
+                    "options": [
+                        {"name": "gearMode", "value": {"workMode": 1, "modeValue": [1, 2, 3]}},
+                        {"name": "Auto", "value": {"workMode": 3, "modeValue": [0]}},
+                    ],
+                },
+            },
+        ),
+    }
+)
+
+_API_FAN_STATE_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "capabilities": (
+            {
+                "type": "devices.capabilities.online",
+                "instance": "online",
+                "state": {"value": True},
+            },
+            {
+                "type": CAPABILITY_ON_OFF,
+                "instance": INSTANCE_POWER,
+                "state": {"value": 1},
+            },
+            {
+                "type": CAPABILITY_TOGGLE,
+                "instance": INSTANCE_OSCILLATION,
+                "state": {"value": 1},
+            },
+            {
+                "type": CAPABILITY_WORK_MODE,
+                "instance": INSTANCE_WORK_MODE,
+                "state": {"value": {"workMode": 1, "modeValue": 2}},
+            },
+        ),
+    }
+)
+
+_API_HDMI_DEVICE_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "device": "AA:BB:CC:DD:EE:FF:00:55",
+        "sku": "H6604",
+        "deviceName": "AI Sync Box",
+        "type": "devices.types.light",
+        "capabilities": (
+            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": {}},
+            {
+                "type": CAPABILITY_MODE,
+                "instance": INSTANCE_HDMI_SOURCE,
+                "parameters": {
+                    "options": [
+                        {"name": "HDMI 1", "value": 1},
+                        {"name": "HDMI 2", "value": 2},
+                        {"name": "HDMI 3", "value": 3},
+                        {"name": "HDMI 4", "value": 4},
+                    ],
+                },
+            },
+        ),
+    }
+)
+
+_API_HDMI_STATE_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "capabilities": (
+            {
+                "type": "devices.capabilities.online",
+                "instance": "online",
+                "state": {"value": True},
+            },
+            {
+                "type": CAPABILITY_ON_OFF,
+                "instance": INSTANCE_POWER,
+                "state": {"value": 1},
+            },
+            {
+                "type": CAPABILITY_MODE,
+                "instance": INSTANCE_HDMI_SOURCE,
+                "state": {"value": 2},
+            },
+        ),
+    }
+)
+
+
 @pytest.fixture
-def mock_api_client() -> Generator[AsyncMock, None, None]:
+def mock_api_client() -> AsyncMock:
     """Create a mock API client."""
+    from custom_components.govee.api import GoveeApiClient
+
     client = AsyncMock(spec=GoveeApiClient)
     client.rate_limit_remaining = 100
     client.rate_limit_total = 100
@@ -56,12 +236,27 @@ def mock_api_client() -> Generator[AsyncMock, None, None]:
     client.control_device = AsyncMock(return_value=True)
     client.get_dynamic_scenes = AsyncMock(return_value=[])
     client.close = AsyncMock()
-    yield client
+    return client
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant, mock_api_client: AsyncMock) -> GoveeCoordinator:
+    """Create a coordinator wired to the mock API client, without MQTT."""
+    from custom_components.govee.coordinator import GoveeCoordinator
+
+    # The coordinator only reads the entry's id and title, so a plain
+    # namespace stands in for the config entry.
+    entry = SimpleNamespace(entry_id="test_entry_id", title="Govee")
+    return GoveeCoordinator(
+        hass, entry, mock_api_client, iot_credentials=None, poll_interval=60
+    )
 
 
 @pytest.fixture
 def mock_iot_credentials() -> GoveeIotCredentials:
     """Create mock IoT credentials."""
+    from custom_components.govee.api import GoveeIotCredentials
+
     return GoveeIotCredentials(
         token="test_token",
         refresh_token="test_refresh",
@@ -74,49 +269,37 @@ def mock_iot_credentials() -> GoveeIotCredentials:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def light_capabilities() -> tuple[GoveeCapability, ...]:
     """Create capabilities for a typical light device."""
     return (
-        GoveeCapability(
-            type=CAPABILITY_ON_OFF,
-            instance=INSTANCE_POWER,
-            parameters={},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_RANGE,
-            instance=INSTANCE_BRIGHTNESS,
-            parameters={"range": {"min": 0, "max": 100}},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_COLOR_SETTING,
-            instance=INSTANCE_COLOR_RGB,
-            parameters={},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_COLOR_SETTING,
-            instance=INSTANCE_COLOR_TEMP,
-            parameters={"range": {"min": 2000, "max": 9000}},
+        _cap(CAPABILITY_ON_OFF, INSTANCE_POWER),
+        _cap(
+            CAPABILITY_RANGE,
+            INSTANCE_BRIGHTNESS,
+            {"range": {"min": 0, "max": 100}},
         ),
-        GoveeCapability(
-            type=CAPABILITY_DYNAMIC_SCENE,
-            instance=INSTANCE_SCENE,
-            parameters={},
+        _cap(CAPABILITY_COLOR_SETTING, INSTANCE_COLOR_RGB),
+        _cap(
+            CAPABILITY_COLOR_SETTING,
+            INSTANCE_COLOR_TEMP,
+            {"range": {"min": 2000, "max": 9000}},
         ),
+        _cap(CAPABILITY_DYNAMIC_SCENE, INSTANCE_SCENE),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rgbic_capabilities(light_capabilities) -> tuple[GoveeCapability, ...]:
     """Create capabilities for an RGBIC device.
 
     Matches real API response structure with fields/elementRange.
     """
     return light_capabilities + (
-        GoveeCapability(
-            type=CAPABILITY_SEGMENT_COLOR,
-            instance="segmentedColorRgb",
-            parameters={
+        _cap(
+            CAPABILITY_SEGMENT_COLOR,
+            "segmentedColorRgb",
+            {
                 "dataType": "STRUCT",
                 "fields": [
                     {
@@ -139,19 +322,15 @@ def rgbic_capabilities(light_capabilities) -> tuple[GoveeCapability, ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def plug_capabilities() -> tuple[GoveeCapability, ...]:
     """Create capabilities for a smart plug."""
     return (
-        GoveeCapability(
-            type=CAPABILITY_ON_OFF,
-            instance=INSTANCE_POWER,
-            parameters={},
-        ),
+        _cap(CAPABILITY_ON_OFF, INSTANCE_POWER),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_light_device(light_capabilities) -> GoveeDevice:
     """Create a mock light device."""
     return GoveeDevice(
@@ -164,7 +343,7 @@ def mock_light_device(light_capabilities) -> GoveeDevice:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rgbic_device(rgbic_capabilities) -> GoveeDevice:
     """Create a mock RGBIC LED strip device."""
     return GoveeDevice(
@@ -177,7 +356,7 @@ def mock_rgbic_device(rgbic_capabilities) -> GoveeDevice:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_plug_device(plug_capabilities) -> GoveeDevice:
     """Create a mock smart plug device."""
     return GoveeDevice(
@@ -190,7 +369,7 @@ def mock_plug_device(plug_capabilities) -> GoveeDevice:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_group_device(light_capabilities) -> GoveeDevice:
     """Create a mock group device."""
     return GoveeDevice(
@@ -244,88 +423,34 @@ def mock_scenes() -> list[dict[str, Any]]:
     ]
 
 
-@pytest.fixture
-def api_device_response() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def api_device_response() -> Mapping[str, Any]:
     """Create a mock API device response."""
-    return {
-        "device": "AA:BB:CC:DD:EE:FF:00:11",
-        "sku": "H6072",
-        "deviceName": "Living Room Light",
-        "type": "devices.types.light",
-        "capabilities": [
-            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": {}},
-            {
-                "type": CAPABILITY_RANGE,
-                "instance": INSTANCE_BRIGHTNESS,
-                "parameters": {"range": {"min": 0, "max": 100}},
-            },
-            {"type": CAPABILITY_COLOR_SETTING, "instance": INSTANCE_COLOR_RGB, "parameters": {}},
-        ],
-    }
+    return _API_DEVICE_RESPONSE
 
 
-@pytest.fixture
-def api_state_response() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def api_state_response() -> Mapping[str, Any]:
     """Create a mock API state response."""
-    return {
-        "capabilities": [
-            {
-                "type": "devices.capabilities.online",
-                "instance": "online",
-                "state": {"value": True},
-            },
-            {
-                "type": CAPABILITY_ON_OFF,
-                "instance": INSTANCE_POWER,
-                "state": {"value": 1},
-            },
-            {
-                "type": CAPABILITY_RANGE,
-                "instance": INSTANCE_BRIGHTNESS,
-                "state": {"value": 75},
-            },
-            {
-                "type": CAPABILITY_COLOR_SETTING,
-                "instance": INSTANCE_COLOR_RGB,
-                "state": {"value": 16744512},  # RGB(255, 128, 64)
-            },
-        ],
-    }
+    return _API_STATE_RESPONSE
 
 
-@pytest.fixture
-def mqtt_state_message() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def mqtt_state_message() -> Mapping[str, Any]:
     """Create a mock MQTT state message."""
-    return {
-        "device": "AA:BB:CC:DD:EE:FF:00:11",
-        "sku": "H6072",
-        "state": {
-            "onOff": 1,
-            "brightness": 75,
-            "color": {"r": 255, "g": 128, "b": 64},
-            "colorTemInKelvin": 0,
-        },
-    }
+    return _MQTT_STATE_MESSAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fan_capabilities() -> tuple[GoveeCapability, ...]:
     """Create capabilities for a fan device (H7101)."""
     return (
-        GoveeCapability(
-            type=CAPABILITY_ON_OFF,
-            instance=INSTANCE_POWER,
-            parameters={},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_TOGGLE,
-            instance=INSTANCE_OSCILLATION,
-            parameters={},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_WORK_MODE,
-            instance=INSTANCE_WORK_MODE,
-            parameters={
+        _cap(CAPABILITY_ON_OFF, INSTANCE_POWER),
+        _cap(CAPABILITY_TOGGLE, INSTANCE_OSCILLATION),
+        _cap(
+            CAPABILITY_WORK_MODE,
+            INSTANCE_WORK_MODE,
+            {
                 "options": [
                     {"name": "gearMode", "value": {"workMode": 1, "modeValue": [1, 2, 3]}},
                     {"name": "Auto", "value": {"workMode": 3, "modeValue": [0]}},
@@ -335,7 +460,7 @@ def fan_capabilities() -> tuple[GoveeCapability, ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_fan_device(fan_capabilities) -> GoveeDevice:
     """Create a mock fan device (H7101)."""
     return GoveeDevice(
@@ -351,86 +476,39 @@ def mock_fan_device(fan_capabilities) -> GoveeDevice:
 @pytest.fixture
 def mock_fan_device_state() -> GoveeDeviceState:
     """Create a mock fan device state."""
-    state = GoveeDeviceState(
+    return GoveeDeviceState(
         device_id="AA:BB:CC:DD:EE:FF:00:44",
         online=True,
         power_state=True,
         brightness=100,
+        oscillating=True,
+        work_mode=1,  # gearMode
+        mode_value=2,  # Medium speed
         source="api",
     )
-    state.oscillating = True
-    state.work_mode = 1  # gearMode
-    state.mode_value = 2  # Medium speed
-    return state
 
 
-@pytest.fixture
-def api_fan_device_response() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def api_fan_device_response() -> Mapping[str, Any]:
     """Create a mock API fan device response (H7101)."""
-    return {
-        "device": "AA:BB:CC:DD:EE:FF:00:44",
-        "sku": "H7101",
-        "deviceName": "Living Room Fan",
-        "type": "devices.types.fan",
-        "capabilities": [
-            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": {}},
-            {"type": CAPABILITY_TOGGLE, "instance": INSTANCE_OSCILLATION, "parameters": {}},
-            {
-                "type": CAPABILITY_WORK_MODE,
-                "instance": INSTANCE_WORK_MODE,
-                "parameters": {
-                    "options": [
-                        {"name": "gearMode", "value": {"workMode": 1, "modeValue": [1, 2, 3]}},
-                        {"name": "Auto", "value": {"workMode": 3, "modeValue": [0]}},
-                    ],
-                },
-            },
-        ],
-    }
+    return _API_FAN_DEVICE_RESPONSE
 
 
-@pytest.fixture
-def api_fan_state_response() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def api_fan_state_response() -> Mapping[str, Any]:
     """Create a mock API fan state response."""
-    return {
-        "capabilities": [
-            {
-                "type": "devices.capabilities.online",
-                "instance": "online",
-                "state": {"value": True},
-            },
-            {
-                "type": CAPABILITY_ON_OFF,
-                "instance": INSTANCE_POWER,
-                "state": {"value": 1},
-            },
-            {
-                "type": CAPABILITY_TOGGLE,
-                "instance": INSTANCE_OSCILLATION,
-                "state": {"value": 1},
-            },
-            {
-                "type": CAPABILITY_WORK_MODE,
-                "instance": INSTANCE_WORK_MODE,
-                "state": {"value": {"workMode": 1, "modeValue": 2}},
-            },
-        ],
-    }
+    return _API_FAN_STATE_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hdmi_capabilities() -> tuple[GoveeCapability, ...]:
     """Create capabilities for an HDMI sync box device (H6604)."""
     return (
-        GoveeCapability(
-            type=CAPABILITY_ON_OFF,
-            instance=INSTANCE_POWER,
-            parameters={},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_MODE,
-            instance=INSTANCE_HDMI_SOURCE,
-            parameters={
+        _cap(CAPABILITY_ON_OFF, INSTANCE_POWER),
+        _cap(
+            CAPABILITY_MODE,
+            INSTANCE_HDMI_SOURCE,
+            {
                 "options": [
                     {"name": "HDMI 1", "value": 1},
                     {"name": "HDMI 2", "value": 2},
@@ -442,7 +520,7 @@ def hdmi_capabilities() -> tuple[GoveeCapability, ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_hdmi_device(hdmi_capabilities) -> GoveeDevice:
     """Create a mock HDMI sync box device (H6604)."""
     return GoveeDevice(
@@ -458,85 +536,42 @@ def mock_hdmi_device(hdmi_capabilities) -> GoveeDevice:
 @pytest.fixture
 def mock_hdmi_device_state() -> GoveeDeviceState:
     """Create a mock HDMI device state."""
-    state = GoveeDeviceState(
+    return GoveeDeviceState(
         device_id="AA:BB:CC:DD:EE:FF:00:55",
         online=True,
         power_state=True,
         brightness=100,
+        hdmi_source=1,  # HDMI 1 selected
         source="api",
     )
-    state.hdmi_source = 1  # HDMI 1 selected
-    return state
 
 
-@pytest.fixture
-def api_hdmi_device_response() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def api_hdmi_device_response() -> Mapping[str, Any]:
     """Create a mock API HDMI device response (H6604)."""
-    return {
-        "device": "AA:BB:CC:DD:EE:FF:00:55",
-        "sku": "H6604",
-        "deviceName": "AI Sync Box",
-        "type": "devices.types.light",
-        "capabilities": [
-            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": {}},
-            {
-                "type": CAPABILITY_MODE,
-                "instance": INSTANCE_HDMI_SOURCE,
-                "parameters": {
-                    "options": [
-                        {"name": "HDMI 1", "value": 1},
-                        {"name": "HDMI 2", "value": 2},
-                        {"name": "HDMI 3", "value": 3},
-                        {"name": "HDMI 4", "value": 4},
-                    ],
-                },
-            },
-        ],
-    }
+    return _API_HDMI_DEVICE_RESPONSE
 
 
-@pytest.fixture
-def api_hdmi_state_response() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def api_hdmi_state_response() -> Mapping[str, Any]:
     """Create a mock API HDMI state response."""
-    return {
-        "capabilities": [
-            {
-                "type": "devices.capabilities.online",
-                "instance": "online",
-                "state": {"value": True},
-            },
-            {
-                "type": CAPABILITY_ON_OFF,
-                "instance": INSTANCE_POWER,
-                "state": {"value": 1},
-            },
-            {
-                "type": CAPABILITY_MODE,
-                "instance": INSTANCE_HDMI_SOURCE,
-                "state": {"value": 2},
-            },
-        ],
-    }
+    return _API_HDMI_STATE_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dreamview_capabilities() -> tuple[GoveeCapability, ...]:
     """Create capabilities for a DreamView-enabled device (e.g., H6199 Immersion)."""
     return (
-        GoveeCapability(
-            type=CAPABILITY_ON_OFF,
-            instance=INSTANCE_POWER,
-            parameters={},
-        ),
-        GoveeCapability(
-            type=CAPABILITY_RANGE,
-            instance=INSTANCE_BRIGHTNESS,
-            parameters={"range": {"min": 0, "max": 100}},
+        _cap(CAPABILITY_ON_OFF, INSTANCE_POWER),
+        _cap(
+            CAPABILITY_RANGE,
+            INSTANCE_BRIGHTNESS,
+            {"range": {"min": 0, "max": 100}},
         ),
-        GoveeCapability(
-            type=CAPABILITY_TOGGLE,
-            instance=INSTANCE_DREAMVIEW,
-            parameters={
+        _cap(
+            CAPABILITY_TOGGLE,
+            INSTANCE_DREAMVIEW,
+            {
                 "dataType": "ENUM",
                 "options": [{"name": "on", "value": 1}, {"name": "off", "value": 0}],
             },
@@ -544,7 +579,7 @@ def dreamview_capabilities() -> tuple[GoveeCapability, ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_dreamview_device(dreamview_capabilities) -> GoveeDevice:
     """Create a mock DreamView-enabled device (e.g., H6199 Immersion)."""
     return GoveeDevice(
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
 
-from custom_components.govee.api.client import GoveeApiClient
+from custom_components.govee.api.client import GoveeApiClient, _parse_scene_options
 from custom_components.govee.api.exceptions import (
     GoveeApiError,
     GoveeAuthError,
@@ -37,11 +38,22 @@ class TestExceptions:
         err = GoveeApiError("Test error")
         assert err.code is None
 
-    def test_govee_auth_error(self):
-        """Test auth error."""
-        err = GoveeAuthError()
-        assert "Invalid API key" in str(err)
-        assert err.code == 401
+    @pytest.mark.parametrize(
+        ("err", "substr", "code"),
+        [
+            (GoveeAuthError(), "Invalid API key", 401),
+            (GoveeRateLimitError(), "Rate limit", 429),
+            (GoveeConnectionError(), "Failed to connect", None),
+            (GoveeDeviceNotFoundError("AA:BB:CC:DD"), "AA:BB:CC:DD", 400),
+        ],
+        ids=lambda v: type(v).__name__ if isinstance(v, Exception) else None,
+    )
+    def test_default_message_and_code(
+        self, err: GoveeApiError, substr: str, code: int | None
+    ):
+        """Test each subclass provides a descriptive message and status code."""
+        assert substr in str(err)
+        assert err.code == code
 
     def test_govee_auth_error_custom_message(self):
         """Test auth error with custom message."""
@@ -50,29 +62,32 @@ class TestExceptions:
         assert err.code == 401
 
     def test_govee_rate_limit_error(self):
-        """Test rate limit error."""
-        err = GoveeRateLimitError()
-        assert "Rate limit" in str(err)
-        assert err.code == 429
-        assert err.retry_after is None
+        """Test rate limit error has no retry_after by default."""
+        assert GoveeRateLimitError().retry_after is None
 
     def test_govee_rate_limit_error_with_retry(self):
         """Test rate limit error with retry_after."""
         err = GoveeRateLimitError(retry_after=30.0)
         assert err.retry_after == 30.0
 
-    def test_govee_connection_error(self):
-        """Test connection error."""
-        err = GoveeConnectionError()
-        assert "connect" in str(err).lower()
-        assert err.code is None
-
     def test_govee_device_not_found_error(self):
-        """Test device not found error."""
-        err = GoveeDeviceNotFoundError("AA:BB:CC:DD")
-        assert "AA:BB:CC:DD" in str(err)
-        assert err.code == 400
-        assert err.device_id == "AA:BB:CC:DD"
+        """Test device not found error keeps the device ID."""
+        assert GoveeDeviceNotFoundError("AA:BB:CC:DD").device_id == "AA:BB:CC:DD"
+
+    @pytest.mark.parametrize(
+        "err",
+        [
+            GoveeAuthError(),
+            GoveeRateLimitError(),
+            GoveeConnectionError(),
+            GoveeDeviceNotFoundError("AA:BB:CC:DD"),
+        ],
+        ids=lambda err: type(err).__name__,
+    )
+    def test_subclass_caught_as_base(self, err: GoveeApiError):
+        """Test every API error subclass can be caught as GoveeApiError."""
+        with pytest.raises(GoveeApiError):
+            raise err
 
 
 # ==============================================================================
@@ -215,6 +230,31 @@ class TestResponseHandling:
         assert len(scenes) == 2
         assert scenes[0]["name"] == "Sunrise"
 
+    def test_parse_scene_options_interns_names(self):
+        """Test parsed scene names are shared across separately decoded responses."""
+        raw = json.dumps(
+            {
+                "payload": {
+                    "capabilities": [
+                        {
+                            "type": "devices.capabilities.dynamic_scene",
+                            "instance": "lightScene",
+                            "parameters": {
+                                "options": [{"name": "Aurora", "value": {"id": 7}}],
+                            },
+                        },
+                        {"type": "devices.capabilities.on_off", "instance": "powerSwitch"},
+                    ],
+                },
+            }
+        )
+
+        first = _parse_scene_options(json.loads(raw))
+        second = _parse_scene_options(json.loads(raw))
+
+        assert first == [{"name": "Aurora", "value": {"id": 7}}]
+        assert first[0]["name"] is second[0]["name"]
+
 
 # ==============================================================================
 # Command Payload Tests
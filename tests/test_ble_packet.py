@@ -9,8 +9,6 @@ import pytest
 from custom_components.govee.api.ble_packet import (
     DREAMVIEW_COMMAND,
     DREAMVIEW_INDICATOR,
-    MUSIC_MODE_COMMAND,
-    MUSIC_MODE_INDICATOR,
     MUSIC_PACKET_PREFIX,
     build_dreamview_packet,
     build_music_mode_packet,
@@ -19,6 +17,39 @@ from custom_components.govee.api.ble_packet import (
     encode_packet_base64,
 )
 
+# Known-good checksums (XOR of bytes 0-18), precomputed so the packet tests
+# act as an oracle for calculate_checksum instead of re-deriving it.
+# Music mode ON: 33 ^ 05 ^ 01 ^ 01 ^ sensitivity
+MUSIC_MODE_ON_CHECKSUMS = {0: 0x36, 25: 0x2F, 50: 0x04, 75: 0x7D, 100: 0x52}
+# DreamView: 33 ^ 05 ^ 04 ^ enabled
+DREAMVIEW_CHECKSUMS = {True: 0x33, False: 0x32}
+
+# (input sensitivity, expected byte 4) across the 0-100 clamp boundaries
+SENSITIVITY_CLAMP_CASES = [
+    (-10, 0),
+    (-1, 0),
+    (0, 0),
+    (1, 1),
+    (50, 50),
+    (75, 75),
+    (99, 99),
+    (100, 100),
+    (101, 100),
+    (150, 100),
+]
+SENSITIVITY_CLAMP_IDS = [
+    "far_below",
+    "just_below",
+    "min",
+    "min_plus_one",
+    "mid",
+    "75",
+    "max_minus_one",
+    "max",
+    "just_above",
+    "far_above",
+]
+
 # ==============================================================================
 # Checksum Tests
 # ==============================================================================
@@ -42,12 +73,9 @@ class TestCalculateChecksum:
 
     def test_multiple_bytes(self):
         """Test checksum of multiple bytes."""
-        # XOR chain: A1 ^ 02 ^ 01 ^ 00 ^ 00 ^ 32
+        # XOR chain: A1 ^ 02 ^ 01 ^ 00 ^ 00 ^ 32 = 0x90
         data = [0xA1, 0x02, 0x01, 0x00, 0x00, 0x32]
-        result = 0
-        for b in data:
-            result ^= b
-        assert calculate_checksum(data) == result
+        assert calculate_checksum(data) == 0x90
 
     def test_all_zeros(self):
         """Test checksum of all zeros."""
@@ -66,6 +94,11 @@ class TestCalculateChecksum:
         result = calculate_checksum([0xFF, 0x01])
         assert 0 <= result <= 255
 
+    def test_accepts_bytes(self):
+        """Test checksum accepts bytes without a list copy."""
+        packet = build_music_mode_packet(True, 50)
+        assert calculate_checksum(packet[:19]) == MUSIC_MODE_ON_CHECKSUMS[50]
+
 
 # ==============================================================================
 # Packet Builder Tests
@@ -75,19 +108,14 @@ class TestCalculateChecksum:
 class TestBuildPacket:
     """Test packet building."""
 
-    def test_packet_always_20_bytes(self):
+    @pytest.mark.parametrize(
+        "data",
+        [[0xA1], [0xA1, 0x02, 0x01, 0x00, 0x00, 0x50], [0x00] * 19],
+        ids=["short", "medium", "full"],
+    )
+    def test_packet_always_20_bytes(self, data: list[int]):
         """Test that packets are always exactly 20 bytes."""
-        # Short data
-        packet = build_packet([0xA1])
-        assert len(packet) == 20
-
-        # Medium data
-        packet = build_packet([0xA1, 0x02, 0x01, 0x00, 0x00, 0x50])
-        assert len(packet) == 20
-
-        # Full data (19 bytes)
-        packet = build_packet([0x00] * 19)
-        assert len(packet) == 20
+        assert len(build_packet(data)) == 20
 
     def test_packet_is_bytes(self):
         """Test that packet is returned as bytes."""
@@ -98,32 +126,23 @@ class TestBuildPacket:
         """Test that input data is preserved in packet."""
         data = [0xA1, 0x02, 0x01, 0x00, 0x00, 0x50]
         packet = build_packet(data)
-        for i, byte in enumerate(data):
-            assert packet[i] == byte
+        assert packet[: len(data)] == bytes(data)
 
     def test_padding_with_zeros(self):
         """Test that short data is padded with zeros."""
         data = [0xA1, 0x02]
         packet = build_packet(data)
 
-        # First two bytes are data
-        assert packet[0] == 0xA1
-        assert packet[1] == 0x02
-
-        # Bytes 2-18 should be zero padding
-        for i in range(2, 19):
-            assert packet[i] == 0x00
+        # First two bytes are data, bytes 2-18 are zero padding
+        assert packet[:2] == b"\xa1\x02"
+        assert packet[2:19] == bytes(17)
 
     def test_checksum_at_end(self):
         """Test that checksum is at byte 19."""
-        data = [0xA1, 0x02, 0x01, 0x00, 0x00, 0x50]
-        packet = build_packet(data)
-
-        # Calculate expected checksum (of first 19 bytes)
-        padded = data + [0x00] * (19 - len(data))
-        expected_checksum = calculate_checksum(padded)
+        packet = build_packet([0xA1, 0x02, 0x01, 0x00, 0x00, 0x50])
 
-        assert packet[19] == expected_checksum
+        # A1 ^ 02 ^ 01 ^ 50 (zero padding does not affect XOR)
+        assert packet[19] == 0xF2
 
     def test_truncates_long_data(self):
         """Test that data longer than 19 bytes is truncated."""
@@ -132,8 +151,7 @@ class TestBuildPacket:
 
         assert len(packet) == 20
         # First 19 bytes should be 0-18
-        for i in range(19):
-            assert packet[i] == i
+        assert packet[:19] == bytes(range(19))
 
 
 # ==============================================================================
@@ -195,6 +213,13 @@ class TestEncodePacketBase64:
 # ==============================================================================
 
 
+@pytest.fixture(scope="module")
+def music_mode_packets() -> dict[int, bytes]:
+    """Build music mode ON packets once for each reference sensitivity."""
+    sensitivities = {s for s, _ in SENSITIVITY_CLAMP_CASES} | set(MUSIC_MODE_ON_CHECKSUMS)
+    return {s: build_music_mode_packet(True, s) for s in sensitivities}
+
+
 class TestBuildMusicModePacket:
     """Test music mode packet building."""
 
@@ -204,33 +229,11 @@ class TestBuildMusicModePacket:
         assert len(packet) == 20
 
     def test_packet_header(self):
-        """Test music mode packet has correct header."""
+        """Test music mode packet header, enabled and sensitivity bytes."""
         packet = build_music_mode_packet(True, 50)
 
-        # Byte 0: Standard command prefix (0x33)
-        assert packet[0] == MUSIC_PACKET_PREFIX
-        assert packet[0] == 0x33
-
-        # Byte 1: Music mode command (0x05)
-        assert packet[1] == MUSIC_MODE_COMMAND
-        assert packet[1] == 0x05
-
-        # Byte 2: Music mode indicator (0x01)
-        assert packet[2] == MUSIC_MODE_INDICATOR
-        assert packet[2] == 0x01
-
-    def test_enabled_byte_position(self):
-        """Test enabled value is at correct position (byte 3)."""
-        packet_on = build_music_mode_packet(True, 50)
-        assert packet_on[3] == 0x01
-
-        packet_off = build_music_mode_packet(False, 50)
-        assert packet_off[3] == 0x00
-
-    def test_sensitivity_byte_position(self):
-        """Test sensitivity value is at correct position (byte 4)."""
-        packet = build_music_mode_packet(True, 75)
-        assert packet[4] == 75
+        # 33 05 01 [ENABLED] [SENSITIVITY]
+        assert packet[:5] == b"\x33\x05\x01\x01\x32"
 
     def test_enabled_on(self):
         """Test music mode enabled packet."""
@@ -242,25 +245,16 @@ class TestBuildMusicModePacket:
         packet = build_music_mode_packet(False, 50)
         assert packet[3] == 0x00
 
-    def test_sensitivity_zero(self):
-        """Test sensitivity 0 (minimum)."""
-        packet = build_music_mode_packet(True, 0)
-        assert packet[4] == 0
-
-    def test_sensitivity_max(self):
-        """Test sensitivity 100 (maximum)."""
-        packet = build_music_mode_packet(True, 100)
-        assert packet[4] == 100
-
-    def test_sensitivity_clamped_below(self):
-        """Test sensitivity below 0 is clamped to 0."""
-        packet = build_music_mode_packet(True, -10)
-        assert packet[4] == 0
-
-    def test_sensitivity_clamped_above(self):
-        """Test sensitivity above 100 is clamped to 100."""
-        packet = build_music_mode_packet(True, 150)
-        assert packet[4] == 100
+    @pytest.mark.parametrize(
+        ("sensitivity", "expected"),
+        SENSITIVITY_CLAMP_CASES,
+        ids=SENSITIVITY_CLAMP_IDS,
+    )
+    def test_sensitivity_byte(
+        self, music_mode_packets: dict[int, bytes], sensitivity: int, expected: int
+    ):
+        """Test sensitivity is written to byte 4 and clamped to 0-100."""
+        assert music_mode_packets[sensitivity][4] == expected
 
     def test_default_sensitivity(self):
         """Test default sensitivity value."""
@@ -270,27 +264,33 @@ class TestBuildMusicModePacket:
     def test_valid_checksum(self):
         """Test packet has valid checksum."""
         packet = build_music_mode_packet(True, 50)
-
-        # Recalculate checksum from first 19 bytes
-        expected_checksum = calculate_checksum(list(packet[:19]))
-        assert packet[19] == expected_checksum
+        assert packet[19] == MUSIC_MODE_ON_CHECKSUMS[50]
 
     @pytest.mark.parametrize("sensitivity", [0, 25, 50, 75, 100])
-    def test_various_sensitivities(self, sensitivity: int):
+    def test_various_sensitivities(
+        self, music_mode_packets: dict[int, bytes], sensitivity: int
+    ):
         """Test packet generation for various sensitivity values."""
-        packet = build_music_mode_packet(True, sensitivity)
-
-        # Verify header
-        assert packet[0] == 0x33
-        assert packet[1] == 0x05
-        assert packet[2] == 0x01
+        packet = music_mode_packets[sensitivity]
 
-        # Verify sensitivity
-        assert packet[4] == sensitivity
+        # Verify header, enabled and sensitivity bytes
+        assert packet[:5] == bytes([0x33, 0x05, 0x01, 0x01, sensitivity])
 
         # Verify checksum
-        expected_checksum = calculate_checksum(list(packet[:19]))
-        assert packet[19] == expected_checksum
+        assert packet[19] == MUSIC_MODE_ON_CHECKSUMS[sensitivity]
+
+    def test_all_sensitivities_bulk(self):
+        """Validate every sensitivity 0-100 in one pass, column by column."""
+        packets = [build_music_mode_packet(True, s) for s in range(101)]
+
+        # Header and enabled byte identical across the whole range
+        assert {p[:4] for p in packets} == {b"\x33\x05\x01\x01"}
+        # Sensitivity column is 0..100 in order
+        assert bytes(p[4] for p in packets) == bytes(range(101))
+        # Padding is all zeros
+        assert {p[5:19] for p in packets} == {bytes(14)}
+        # Header bytes XOR to 0x36, so checksum is 0x36 ^ sensitivity
+        assert bytes(p[19] for p in packets) == bytes(0x36 ^ s for s in range(101))
 
 
 # ==============================================================================
@@ -348,28 +348,14 @@ class TestBuildDreamviewPacket:
         assert len(packet) == 20
 
     def test_packet_header(self):
-        """Test DreamView packet has correct header."""
+        """Test DreamView packet header and enabled byte."""
         packet = build_dreamview_packet(True)
 
-        # Byte 0: Standard command prefix (0x33)
-        assert packet[0] == MUSIC_PACKET_PREFIX
-        assert packet[0] == 0x33
-
-        # Byte 1: DreamView command (0x05, same as music mode)
-        assert packet[1] == DREAMVIEW_COMMAND
-        assert packet[1] == 0x05
-
-        # Byte 2: DreamView indicator (0x04, scene mode)
-        assert packet[2] == DREAMVIEW_INDICATOR
-        assert packet[2] == 0x04
-
-    def test_enabled_byte_position(self):
-        """Test enabled value is at correct position (byte 3)."""
-        packet_on = build_dreamview_packet(True)
-        assert packet_on[3] == 0x01
-
-        packet_off = build_dreamview_packet(False)
-        assert packet_off[3] == 0x00
+        # 33 05 04 [ENABLED]
+        assert packet[:4] == b"\x33\x05\x04\x01"
+        assert packet[:3] == bytes(
+            [MUSIC_PACKET_PREFIX, DREAMVIEW_COMMAND, DREAMVIEW_INDICATOR]
+        )
 
     def test_enabled_on(self):
         """Test DreamView enabled packet."""
@@ -383,11 +369,8 @@ class TestBuildDreamviewPacket:
 
     def test_valid_checksum(self):
         """Test packet has valid checksum."""
-        packet = build_dreamview_packet(True)
-
-        # Recalculate checksum from first 19 bytes
-        expected_checksum = calculate_checksum(list(packet[:19]))
-        assert packet[19] == expected_checksum
+        assert build_dreamview_packet(True)[19] == DREAMVIEW_CHECKSUMS[True]
+        assert build_dreamview_packet(False)[19] == DREAMVIEW_CHECKSUMS[False]
 
     def test_different_from_music_mode(self):
         """Test DreamView packet differs from music mode packet."""
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+
 import pytest
 
 from custom_components.govee.api.exceptions import GoveeApiError, GoveeAuthError
@@ -14,13 +17,28 @@ from custom_components.govee.const import (
     CONF_ENABLE_SEGMENTS,
     CONF_PASSWORD,
     CONF_POLL_INTERVAL,
+    CONFIG_VERSION,
     DEFAULT_ENABLE_GROUPS,
     DEFAULT_ENABLE_SCENES,
     DEFAULT_ENABLE_SEGMENTS,
     DEFAULT_POLL_INTERVAL,
     DOMAIN,
 )
+from custom_components.govee.repairs import (
+    ISSUE_AUTH_FAILED,
+    ISSUE_MQTT_DISCONNECTED,
+    ISSUE_RATE_LIMITED,
+)
 
+# Options as stored on a freshly created entry; tests overlay their changes
+_DEFAULT_OPTIONS: Mapping[str, Any] = MappingProxyType(
+    {
+        CONF_POLL_INTERVAL: DEFAULT_POLL_INTERVAL,
+        CONF_ENABLE_GROUPS: DEFAULT_ENABLE_GROUPS,
+        CONF_ENABLE_SCENES: DEFAULT_ENABLE_SCENES,
+        CONF_ENABLE_SEGMENTS: DEFAULT_ENABLE_SEGMENTS,
+    }
+)
 
 # ==============================================================================
 # Config Flow Logic Tests (without Home Assistant dependencies)
@@ -95,12 +113,7 @@ class TestOptionsDefaults:
 
     def test_default_options(self):
         """Test default options are correct."""
-        options = {
-            CONF_POLL_INTERVAL: DEFAULT_POLL_INTERVAL,
-            CONF_ENABLE_GROUPS: DEFAULT_ENABLE_GROUPS,
-            CONF_ENABLE_SCENES: DEFAULT_ENABLE_SCENES,
-            CONF_ENABLE_SEGMENTS: DEFAULT_ENABLE_SEGMENTS,
-        }
+        options = _DEFAULT_OPTIONS
 
         assert options[CONF_POLL_INTERVAL] == 60
         assert options[CONF_ENABLE_GROUPS] is False
@@ -137,20 +150,18 @@ class TestEntryDataStructure:
 class TestErrorHandling:
     """Test error handling patterns."""
 
-    def test_auth_error_code(self):
-        """Test auth error has correct code."""
-        err = GoveeAuthError("Invalid API key")
-        assert err.code == 401
-
-    def test_api_error_code(self):
-        """Test API error can have custom code."""
-        err = GoveeApiError("Server error", code=500)
-        assert err.code == 500
-
-    def test_api_error_no_code(self):
-        """Test API error without code."""
-        err = GoveeApiError("Network error")
-        assert err.code is None
+    @pytest.mark.parametrize(
+        ("err", "code"),
+        [
+            (GoveeAuthError("Invalid API key"), 401),
+            (GoveeApiError("Server error", code=500), 500),
+            (GoveeApiError("Network error"), None),
+        ],
+        ids=["auth", "api_custom_code", "api_no_code"],
+    )
+    def test_error_code(self, err, code):
+        """Test error codes surfaced to the config flow."""
+        assert err.code == code
 
 
 class TestReauthFlow:
@@ -178,17 +189,11 @@ class TestOptionsFlow:
 
     def test_options_update(self):
         """Test options can be updated."""
-        # Original options
-        original = {
-            CONF_POLL_INTERVAL: 60,
-            CONF_ENABLE_GROUPS: False,
-            CONF_ENABLE_SCENES: True,
-            CONF_ENABLE_SEGMENTS: True,
-        }
-        assert original[CONF_POLL_INTERVAL] == 60
+        assert _DEFAULT_OPTIONS[CONF_POLL_INTERVAL] == 60
 
         # Update options
         new_options = {
+            **_DEFAULT_OPTIONS,
             CONF_POLL_INTERVAL: 120,
             CONF_ENABLE_GROUPS: True,
             CONF_ENABLE_SCENES: False,
@@ -280,31 +285,21 @@ class TestConfigFlowVersion:
 
     def test_config_version(self):
         """Test config version is 1."""
-        from custom_components.govee.const import CONFIG_VERSION
-
         assert CONFIG_VERSION == 1
 
 
 class TestFormValidation:
     """Test form validation patterns."""
 
-    def test_api_key_empty_invalid(self):
-        """Test empty API key is invalid."""
-        api_key = ""
-        is_valid = bool(api_key and api_key.strip())
-        assert is_valid is False
-
-    def test_api_key_whitespace_invalid(self):
-        """Test whitespace-only API key is invalid."""
-        api_key = "   "
+    @pytest.mark.parametrize(
+        ("api_key", "expected"),
+        [("", False), ("   ", False), ("valid_api_key_here", True)],
+        ids=["empty", "whitespace", "valid"],
+    )
+    def test_api_key_validity(self, api_key, expected):
+        """Test empty and whitespace-only API keys are invalid."""
         is_valid = bool(api_key and api_key.strip())
-        assert is_valid is False
-
-    def test_api_key_valid(self):
-        """Test valid API key passes."""
-        api_key = "valid_api_key_here"
-        is_valid = bool(api_key and api_key.strip())
-        assert is_valid is True
+        assert is_valid is expected
 
 
 class TestErrorMessages:
@@ -347,7 +342,6 @@ class TestDescriptionPlaceholders:
 class TestConfigFlowAsync:
     """Test async patterns used in config flow."""
 
-    @pytest.mark.asyncio
     async def test_async_validate_api_key_mock(self):
         """Test async API key validation mock."""
         async def mock_validate(api_key: str) -> bool:
@@ -361,12 +355,11 @@ class TestConfigFlowAsync:
         with pytest.raises(GoveeAuthError):
             await mock_validate("invalid_key")
 
-    @pytest.mark.asyncio
     async def test_async_validate_credentials_mock(self):
         """Test async credentials validation mock."""
         async def mock_validate(email: str, password: str):
             if email == "valid@test.com" and password == "correct":
-                return MagicMock()  # Return mock IoT credentials
+                return SimpleNamespace()  # Stand-in IoT credentials
             raise GoveeAuthError("Invalid credentials")
 
         result = await mock_validate("valid@test.com", "correct")
@@ -435,20 +428,12 @@ class TestRepairsFramework:
 
     def test_issue_ids(self):
         """Test issue ID constants."""
-        from custom_components.govee.repairs import (
-            ISSUE_AUTH_FAILED,
-            ISSUE_MQTT_DISCONNECTED,
-            ISSUE_RATE_LIMITED,
-        )
-
         assert ISSUE_AUTH_FAILED == "auth_failed"
         assert ISSUE_RATE_LIMITED == "rate_limited"
         assert ISSUE_MQTT_DISCONNECTED == "mqtt_disconnected"
 
     def test_issue_id_format(self):
         """Test issue ID format with entry ID."""
-        from custom_components.govee.repairs import ISSUE_AUTH_FAILED
-
         entry_id = "test_entry_123"
         issue_id = f"{ISSUE_AUTH_FAILED}_{entry_id}"
 
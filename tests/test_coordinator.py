@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import gc
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -14,6 +18,11 @@ from custom_components.govee.api.exceptions import (
     GoveeDeviceNotFoundError,
     GoveeRateLimitError,
 )
+from custom_components.govee.coordinator import (
+    MAX_CONCURRENT_REQUESTS,
+    SCENE_CACHE_ERROR_TTL,
+    SCENE_CACHE_TTL,
+)
 from custom_components.govee.models import (
     GoveeCapability,
     GoveeDevice,
@@ -23,6 +32,7 @@ from custom_components.govee.models import (
     ColorCommand,
     ColorTempCommand,
     SceneCommand,
+    SegmentColorCommand,
     RGBColor,
 )
 from custom_components.govee.models.device import (
@@ -33,13 +43,41 @@ from custom_components.govee.models.device import (
 )
 from custom_components.govee.protocols import IStateObserver
 
+# Read-only payloads shared by the state update tests
+_API_ONLINE_POWER_ON: Mapping[str, Any] = MappingProxyType(
+    {
+        "capabilities": (
+            {
+                "type": "devices.capabilities.online",
+                "instance": "online",
+                "state": {"value": True},
+            },
+            {
+                "type": "devices.capabilities.on_off",
+                "instance": "powerSwitch",
+                "state": {"value": 1},
+            },
+        ),
+    }
+)
+
+_MQTT_ON_DIM_COLOR: Mapping[str, Any] = MappingProxyType(
+    {
+        "onOff": 1,
+        "brightness": 50,
+        "color": {"r": 100, "g": 150, "b": 200},
+    }
+)
+
+_MQTT_OFF_DIM: Mapping[str, Any] = MappingProxyType({"onOff": 0, "brightness": 25})
+
 
 # ==============================================================================
 # Fixtures
 # ==============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_capabilities():
     """Create sample light capabilities."""
     return (
@@ -52,7 +90,7 @@ def sample_capabilities():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_device(sample_capabilities):
     """Create a sample device."""
     return GoveeDevice(
@@ -65,7 +103,7 @@ def sample_device(sample_capabilities):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_group_device(sample_capabilities):
     """Create a sample group device."""
     return GoveeDevice(
@@ -243,8 +281,7 @@ class TestDeviceFiltering:
 
         filtered = [d for d in devices if not d.is_group or enable_groups]
 
-        assert len(filtered) == 1
-        assert filtered[0] == sample_device
+        assert filtered == [sample_device]
 
     def test_include_groups_when_enabled(self, sample_device, sample_group_device):
         """Test group devices included when groups enabled."""
@@ -253,7 +290,7 @@ class TestDeviceFiltering:
 
         filtered = [d for d in devices if not d.is_group or enable_groups]
 
-        assert len(filtered) == 2
+        assert filtered == devices
 
 
 class TestSceneCaching:
@@ -320,22 +357,7 @@ class TestStateManagement:
         """Test state update from API response."""
         state = GoveeDeviceState.create_empty("device_id")
 
-        api_data = {
-            "capabilities": [
-                {
-                    "type": "devices.capabilities.online",
-                    "instance": "online",
-                    "state": {"value": True},
-                },
-                {
-                    "type": "devices.capabilities.on_off",
-                    "instance": "powerSwitch",
-                    "state": {"value": 1},
-                },
-            ],
-        }
-
-        state.update_from_api(api_data)
+        state.update_from_api(_API_ONLINE_POWER_ON)
 
         assert state.online is True
         assert state.power_state is True
@@ -345,13 +367,7 @@ class TestStateManagement:
         """Test state update from MQTT message."""
         state = GoveeDeviceState.create_empty("device_id")
 
-        mqtt_data = {
-            "onOff": 1,
-            "brightness": 50,
-            "color": {"r": 100, "g": 150, "b": 200},
-        }
-
-        state.update_from_mqtt(mqtt_data)
+        state.update_from_mqtt(_MQTT_ON_DIM_COLOR)
 
         assert state.power_state is True
         assert state.brightness == 50
@@ -411,13 +427,13 @@ class TestErrorHandling:
 class TestMqttIntegration:
     """Test MQTT integration patterns."""
 
-    def test_mqtt_state_update_flow(self, sample_state):
+    def test_mqtt_state_update_flow(self, sample_state, sample_device):
         """Test MQTT state update is applied correctly."""
         states = {"device_id": sample_state}
-        devices = {"device_id": MagicMock()}
+        devices = {"device_id": sample_device}
 
         device_id = "device_id"
-        mqtt_data = {"onOff": 0, "brightness": 25}
+        mqtt_data = _MQTT_OFF_DIM
 
         if device_id in devices:
             state = states.get(device_id)
@@ -428,9 +444,9 @@ class TestMqttIntegration:
         assert sample_state.brightness == 25
         assert sample_state.source == "mqtt"
 
-    def test_mqtt_unknown_device_ignored(self):
+    def test_mqtt_unknown_device_ignored(self, sample_device):
         """Test MQTT updates for unknown devices are ignored."""
-        devices = {"known_device": MagicMock()}
+        devices = {"known_device": sample_device}
 
         unknown_device_id = "unknown_device"
 
@@ -445,7 +461,6 @@ class TestMqttIntegration:
 class TestParallelStateFetching:
     """Test parallel state fetching patterns."""
 
-    @pytest.mark.asyncio
     async def test_parallel_fetch_creates_tasks(self, sample_device):
         """Test parallel fetch creates tasks for all devices."""
         devices = {
@@ -467,7 +482,6 @@ class TestParallelStateFetching:
         assert len(results) == 3
         assert all(isinstance(r, GoveeDeviceState) for r in results)
 
-    @pytest.mark.asyncio
     async def test_parallel_fetch_handles_exceptions(self, sample_device):
         """Test parallel fetch handles individual failures."""
 
@@ -488,6 +502,33 @@ class TestParallelStateFetching:
         assert isinstance(results[1], GoveeApiError)
         assert isinstance(results[2], GoveeDeviceState)
 
+    async def test_update_routes_states_by_device_id(
+        self, coordinator, mock_api_client, mock_light_device, mock_plug_device
+    ):
+        """Test each state lands on its own device whatever order fetches finish."""
+        responses = {
+            mock_light_device.device_id: GoveeDeviceState(
+                device_id=mock_light_device.device_id, brightness=25
+            ),
+            mock_plug_device.device_id: GoveeDeviceState(
+                device_id=mock_plug_device.device_id, power_state=True
+            ),
+        }
+
+        async def fetch(device_id: str, sku: str) -> GoveeDeviceState:
+            # Let the first device finish last
+            if device_id == mock_light_device.device_id:
+                await asyncio.sleep(0)
+            return responses[device_id]
+
+        mock_api_client.get_device_state.side_effect = fetch
+        for device in (mock_light_device, mock_plug_device):
+            coordinator.devices[device.device_id] = device
+
+        states = await coordinator._async_update_data()
+
+        assert states == responses
+
 
 class TestOptimisticUpdates:
     """Test optimistic state update patterns."""
@@ -593,7 +634,10 @@ class TestCoordinatorDeviceRegistry:
             sample_group_device.device_id: sample_group_device,
         }
 
-        assert len(devices) == 2
+        assert set(devices) == {
+            "AA:BB:CC:DD:EE:FF:00:11",
+            "GROUP:AA:BB:CC:DD",
+        }
 
 
 class TestCoordinatorSceneManagement:
@@ -631,3 +675,541 @@ class TestCoordinatorSceneManagement:
             del cache["device_id"]
 
         assert "device_id" not in cache
+
+
+class TestSceneFetchCoalescing:
+    """Test concurrent scene lookups share one API request."""
+
+    async def test_concurrent_misses_share_one_call(
+        self, coordinator, mock_api_client, mock_light_device
+    ):
+        """Test two callers missing the cache trigger a single fetch."""
+        scenes = [{"name": "Sunrise", "value": {"id": 1}}]
+
+        async def slow_fetch(*_: Any) -> list[dict[str, Any]]:
+            await asyncio.sleep(0)  # let the second caller miss the cache too
+            return scenes
+
+        mock_api_client.get_dynamic_scenes.side_effect = slow_fetch
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+
+        first, second = await asyncio.gather(
+            coordinator.async_get_scenes(mock_light_device.device_id),
+            coordinator.async_get_scenes(mock_light_device.device_id),
+        )
+
+        assert first == second == scenes
+        mock_api_client.get_dynamic_scenes.assert_awaited_once()
+
+    async def test_failed_fetch_without_waiters_is_retrieved(
+        self, coordinator, mock_api_client, mock_light_device
+    ):
+        """Test a fetch failing after its waiters were cancelled isn't logged."""
+        release = asyncio.Event()
+
+        async def failing_fetch(*_: Any) -> list[dict[str, Any]]:
+            await release.wait()
+            raise GoveeApiError("Server error")
+
+        mock_api_client.get_dynamic_scenes.side_effect = failing_fetch
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+        loop = asyncio.get_running_loop()
+        handler = loop.get_exception_handler()
+        errors: list[dict[str, Any]] = []
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            waiter = asyncio.create_task(
+                coordinator.async_get_scenes(mock_light_device.device_id)
+            )
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+            release.set()
+            while coordinator._scene_fetches:
+                await asyncio.sleep(0)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(handler)
+
+        assert errors == []
+
+
+class TestScenePrefetch:
+    """Test discovery prefetches scene lists in parallel, within the limit."""
+
+    async def test_prefetches_overlap_up_to_request_limit(
+        self, coordinator, mock_api_client, light_capabilities
+    ):
+        """Test prefetches run concurrently but never past the semaphore."""
+        devices = [
+            GoveeDevice(
+                device_id=f"AA:BB:CC:DD:EE:FF:01:{index:02X}",
+                sku="H6072",
+                name=f"Light {index}",
+                device_type="devices.types.light",
+                capabilities=light_capabilities,
+                is_group=False,
+            )
+            for index in range(MAX_CONCURRENT_REQUESTS * 2 + 1)
+        ]
+        in_flight = peak = 0
+
+        async def fetch(*_: Any) -> list[dict[str, Any]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        mock_api_client.get_devices.return_value = devices
+        mock_api_client.get_dynamic_scenes.side_effect = fetch
+        mock_api_client.get_diy_scenes.return_value = []
+
+        await coordinator._discover_devices()
+
+        assert mock_api_client.get_dynamic_scenes.await_count == len(devices)
+        # Sequential prefetches would never overlap
+        assert peak > 1
+        assert peak <= MAX_CONCURRENT_REQUESTS
+
+
+_SCENE_GETTERS = pytest.mark.parametrize(
+    ("getter", "api_method"),
+    [
+        ("async_get_scenes", "get_dynamic_scenes"),
+        ("async_get_diy_scenes", "get_diy_scenes"),
+    ],
+    ids=["dynamic", "diy"],
+)
+
+
+class TestSceneCacheExpiry:
+    """Test scene cache TTLs and the fallback after a failed refetch."""
+
+    @_SCENE_GETTERS
+    async def test_expired_entry_is_refetched(
+        self,
+        coordinator,
+        mock_api_client,
+        mock_light_device,
+        freezer,
+        getter,
+        api_method,
+    ):
+        """Test scenes are served from cache until SCENE_CACHE_TTL passes."""
+        old = [{"name": "Sunrise", "value": {"id": 1}}]
+        new = [{"name": "Sunset", "value": {"id": 2}}]
+        fetch = getattr(mock_api_client, api_method)
+        fetch.return_value = old
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+        get_scenes = getattr(coordinator, getter)
+
+        assert await get_scenes(mock_light_device.device_id) == old
+        freezer.tick(SCENE_CACHE_TTL - 1)
+        assert await get_scenes(mock_light_device.device_id) == old
+        assert fetch.await_count == 1
+
+        fetch.return_value = new
+        freezer.tick(2)
+        assert await get_scenes(mock_light_device.device_id) == new
+        assert fetch.await_count == 2
+
+    @_SCENE_GETTERS
+    async def test_failed_refetch_serves_stale_list(
+        self,
+        coordinator,
+        mock_api_client,
+        mock_light_device,
+        freezer,
+        getter,
+        api_method,
+    ):
+        """Test a failed refetch keeps the old list for SCENE_CACHE_ERROR_TTL."""
+        scenes = [{"name": "Sunrise", "value": {"id": 1}}]
+        fetch = getattr(mock_api_client, api_method)
+        fetch.return_value = scenes
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+        get_scenes = getattr(coordinator, getter)
+        await get_scenes(mock_light_device.device_id)
+
+        fetch.side_effect = GoveeApiError("Server error")
+        freezer.tick(SCENE_CACHE_TTL + 1)
+        assert await get_scenes(mock_light_device.device_id) == scenes
+        assert fetch.await_count == 2
+
+        # The stale list is re-cached for the back-off period only
+        freezer.tick(SCENE_CACHE_ERROR_TTL - 1)
+        assert await get_scenes(mock_light_device.device_id) == scenes
+        assert fetch.await_count == 2
+        freezer.tick(2)
+        assert await get_scenes(mock_light_device.device_id) == scenes
+        assert fetch.await_count == 3
+
+
+class TestControlDeviceFailure:
+    """Test failed control commands leave state untouched."""
+
+    async def test_api_error_keeps_previous_state(
+        self, coordinator, mock_api_client, mock_light_device
+    ):
+        """Test a failed power command doesn't apply an optimistic update."""
+        mock_api_client.control_device.side_effect = GoveeApiError("Server error")
+        device_id = mock_light_device.device_id
+        coordinator.devices[device_id] = mock_light_device
+        coordinator.states[device_id] = GoveeDeviceState.create_empty(device_id)
+
+        result = await coordinator.async_control_device(
+            device_id, PowerCommand(power_on=True)
+        )
+
+        assert result is False
+        assert coordinator.states[device_id].power_state is False
+        assert coordinator.states[device_id].source == "api"
+
+
+class TestControlDeviceNotification:
+    """Test successful commands only notify listeners on a state change."""
+
+    @pytest.mark.parametrize(
+        ("power_state", "notified"),
+        [(False, True), (True, False)],
+        ids=["changed", "already_on"],
+    )
+    async def test_notifies_only_on_change(
+        self, coordinator, mock_api_client, mock_light_device, power_state, notified
+    ):
+        """Test a command matching the current state skips the listener update."""
+        mock_api_client.control_device.return_value = True
+        device_id = mock_light_device.device_id
+        coordinator.devices[device_id] = mock_light_device
+        coordinator.states[device_id] = GoveeDeviceState(
+            device_id=device_id, power_state=power_state
+        )
+        listener = MagicMock()
+        unsubscribe = coordinator.async_add_listener(listener)
+
+        result = await coordinator.async_control_device(
+            device_id, PowerCommand(power_on=True)
+        )
+        unsubscribe()
+
+        assert result is True
+        assert coordinator.states[device_id].power_state is True
+        assert listener.called is notified
+
+
+class TestCommandCoalescing:
+    """Test commands queued behind an in-flight send are coalesced."""
+
+    @pytest.mark.parametrize(
+        ("commands", "sent"),
+        [
+            (
+                (
+                    BrightnessCommand(brightness=20),
+                    BrightnessCommand(brightness=50),
+                    BrightnessCommand(brightness=80),
+                ),
+                (BrightnessCommand(brightness=20), BrightnessCommand(brightness=80)),
+            ),
+            (
+                (PowerCommand(power_on=True), BrightnessCommand(brightness=80)),
+                (PowerCommand(power_on=True), BrightnessCommand(brightness=80)),
+            ),
+            (
+                (
+                    SegmentColorCommand((0,), RGBColor(255, 0, 0)),
+                    SegmentColorCommand((1,), RGBColor(0, 0, 255)),
+                ),
+                (
+                    SegmentColorCommand((0,), RGBColor(255, 0, 0)),
+                    SegmentColorCommand((1,), RGBColor(0, 0, 255)),
+                ),
+            ),
+        ],
+        ids=["same_capability", "different_capabilities", "different_segments"],
+    )
+    async def test_latest_queued_command_wins(
+        self, coordinator, mock_api_client, mock_light_device, commands, sent
+    ):
+        """Test the first command goes out at once and the latest queued follows."""
+        release = asyncio.Event()
+
+        async def control(*args: Any) -> bool:
+            await release.wait()
+            return True
+
+        mock_api_client.control_device.side_effect = control
+        device_id = mock_light_device.device_id
+        coordinator.devices[device_id] = mock_light_device
+
+        calls = [
+            asyncio.create_task(coordinator.async_control_device(device_id, cmd))
+            for cmd in commands
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*calls) == [True] * len(commands)
+        assert [
+            call.args[2] for call in mock_api_client.control_device.await_args_list
+        ] == list(sent)
+        assert not coordinator._command_sends
+        assert not coordinator._pending_commands
+
+    async def test_cancelled_send_does_not_block_later_commands(
+        self, coordinator, mock_api_client, mock_light_device
+    ):
+        """Test a send cancelled mid-flight leaves nothing for later commands."""
+        release = asyncio.Event()
+
+        async def control(*args: Any) -> bool:
+            await release.wait()
+            return True
+
+        mock_api_client.control_device.side_effect = control
+        device_id = mock_light_device.device_id
+        coordinator.devices[device_id] = mock_light_device
+
+        first = asyncio.create_task(
+            coordinator.async_control_device(device_id, BrightnessCommand(20))
+        )
+        await asyncio.sleep(0)
+        await coordinator.async_shutdown()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert not coordinator._command_sends
+        assert not coordinator._pending_commands
+
+        release.set()
+        assert await coordinator.async_control_device(
+            device_id, BrightnessCommand(80)
+        )
+
+
+class TestRateLimitPreflight:
+    """Test polls are skipped when the remaining quota can't cover them."""
+
+    @pytest.mark.parametrize(
+        ("remaining", "reset_in", "fetched"),
+        [
+            (0, 60, False),
+            (0, -1, True),
+            (5, 60, True),
+        ],
+        ids=["exhausted", "window_reset", "quota_left"],
+    )
+    async def test_poll_respects_quota(
+        self,
+        coordinator,
+        mock_api_client,
+        mock_light_device,
+        remaining,
+        reset_in,
+        fetched,
+    ):
+        """Test the poll only hits the API when quota remains or has reset."""
+        mock_api_client.rate_limit_remaining = remaining
+        mock_api_client.rate_limit_reset = int(time.time()) + reset_in
+        mock_api_client.get_device_state.return_value = GoveeDeviceState.create_empty(
+            mock_light_device.device_id
+        )
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+
+        await coordinator._async_update_data()
+
+        assert mock_api_client.get_device_state.await_count == int(fetched)
+
+
+class TestChangedDeviceTracking:
+    """Test the coordinator reports which devices changed per update."""
+
+    async def test_poll_reports_only_changed_devices(
+        self, coordinator, mock_api_client, mock_light_device, mock_plug_device
+    ):
+        """Test unchanged states drop out of last_changed_device_ids."""
+        brightness = {mock_light_device.device_id: 50, mock_plug_device.device_id: 50}
+
+        async def fetch(device_id: str, sku: str) -> GoveeDeviceState:
+            return GoveeDeviceState(
+                device_id=device_id, brightness=brightness[device_id]
+            )
+
+        mock_api_client.get_device_state.side_effect = fetch
+        for device in (mock_light_device, mock_plug_device):
+            coordinator.devices[device.device_id] = device
+
+        await coordinator._async_update_data()
+        assert coordinator.last_changed_device_ids == set(brightness)
+
+        await coordinator._async_update_data()
+        assert coordinator.last_changed_device_ids == frozenset()
+
+        brightness[mock_plug_device.device_id] = 80
+        await coordinator._async_update_data()
+        assert coordinator.last_changed_device_ids == {mock_plug_device.device_id}
+
+    async def test_unscoped_update_reaches_all_devices(
+        self, coordinator, mock_light_device
+    ):
+        """Test the change set only applies to its own listener round."""
+        seen = []
+        unsubscribe = coordinator.async_add_listener(
+            lambda: seen.append(coordinator.last_changed_device_ids)
+        )
+        coordinator.states[mock_light_device.device_id] = (
+            GoveeDeviceState.create_empty(mock_light_device.device_id)
+        )
+
+        coordinator._async_notify_devices((mock_light_device.device_id,))
+        coordinator.async_update_listeners()
+        unsubscribe()
+
+        assert seen == [frozenset((mock_light_device.device_id,)), None]
+
+    async def test_diy_style_notifies_device(self, coordinator, mock_light_device):
+        """Test optimistic BLE-path updates reach the device's entities."""
+        device_id = mock_light_device.device_id
+        coordinator.devices[device_id] = mock_light_device
+        coordinator.states[device_id] = GoveeDeviceState.create_empty(device_id)
+        seen = []
+        unsubscribe = coordinator.async_add_listener(
+            lambda: seen.append(coordinator.last_changed_device_ids)
+        )
+
+        assert await coordinator.async_send_diy_style(device_id, "Fade")
+        unsubscribe()
+
+        assert seen == [frozenset((device_id,))]
+
+
+class TestOptimisticStatePreservation:
+    """Test polls keep optimistic state the API doesn't report."""
+
+    @pytest.mark.parametrize(
+        ("power_on", "expected_scene", "expected_music"),
+        [(True, "scene_1", 3), (False, None, None)],
+        ids=["device_on", "device_off"],
+    )
+    async def test_poll_merges_optimistic_fields(
+        self,
+        coordinator,
+        mock_api_client,
+        mock_light_device,
+        power_on,
+        expected_scene,
+        expected_music,
+    ):
+        """Test scene and music mode survive a poll only while powered on."""
+        device_id = mock_light_device.device_id
+        mock_api_client.get_device_state.return_value = GoveeDeviceState(
+            device_id=device_id, power_state=power_on
+        )
+        coordinator.devices[device_id] = mock_light_device
+        previous = GoveeDeviceState.create_empty(device_id)
+        previous.apply_optimistic_scene("scene_1")
+        previous.music_mode_value = 3
+        previous.music_mode_enabled = True
+        coordinator.states[device_id] = previous
+
+        await coordinator._async_update_data()
+
+        state = coordinator.states[device_id]
+        assert state.active_scene == expected_scene
+        assert state.music_mode_value == expected_music
+
+
+class TestScenePersistence:
+    """Test scene caches survive restarts via the scene store."""
+
+    async def test_restored_scenes_skip_api(
+        self, coordinator, mock_api_client, mock_light_device, hass_storage
+    ):
+        """Test unexpired stored scenes are served and expired ones dropped."""
+        now = time.time()
+        scenes = [{"name": "Sunrise", "value": {"id": 1}}]
+        hass_storage[coordinator._scene_store.key] = {
+            "version": 1,
+            "key": coordinator._scene_store.key,
+            "data": {
+                "dynamic": {
+                    mock_light_device.device_id: [now + 60, scenes],
+                    "stale": [now - 60, scenes],
+                },
+                "diy": {},
+            },
+        }
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+
+        await coordinator._async_load_scenes()
+
+        assert "stale" not in coordinator._scene_cache
+        assert await coordinator.async_get_scenes(mock_light_device.device_id) == scenes
+        mock_api_client.get_dynamic_scenes.assert_not_awaited()
+
+    async def test_shutdown_persists_scenes(
+        self, coordinator, mock_api_client, mock_light_device, hass_storage
+    ):
+        """Test fetched scenes are written to the store on shutdown."""
+        scenes = [{"name": "Sunrise", "value": {"id": 1}}]
+        mock_api_client.get_dynamic_scenes.return_value = scenes
+        coordinator.devices[mock_light_device.device_id] = mock_light_device
+
+        await coordinator.async_get_scenes(mock_light_device.device_id)
+        await coordinator.async_shutdown()
+
+        stored = hass_storage[coordinator._scene_store.key]["data"]
+        assert stored["dynamic"][mock_light_device.device_id][1] == scenes
+
+    async def test_malformed_entries_are_skipped(
+        self, coordinator, mock_light_device, hass_storage
+    ):
+        """Test entries in an unexpected shape are dropped instead of failing."""
+        now = time.time()
+        scenes = [{"name": "Sunrise", "value": {"id": 1}}]
+        hass_storage[coordinator._scene_store.key] = {
+            "version": 1,
+            "key": coordinator._scene_store.key,
+            "data": {
+                "dynamic": {
+                    mock_light_device.device_id: [now + 60, scenes],
+                    "not_a_pair": [now + 60],
+                    "bad_expiry": ["soon", scenes],
+                    "bad_scenes": [now + 60, "Sunrise"],
+                    "not_a_list": now + 60,
+                },
+                "diy": None,
+            },
+        }
+
+        await coordinator._async_load_scenes()
+
+        assert list(coordinator._scene_cache) == [mock_light_device.device_id]
+        assert coordinator._diy_scene_cache == {}
+
+    async def test_other_store_version_is_discarded(self, coordinator, hass_storage):
+        """Test caches stored in another format are dropped on load."""
+        hass_storage[coordinator._scene_store.key] = {
+            "version": 0,
+            "key": coordinator._scene_store.key,
+            "data": [["device", "scenes"]],
+        }
+
+        await coordinator._async_load_scenes()
+
+        assert coordinator._scene_cache == {}
+        assert hass_storage[coordinator._scene_store.key]["data"] == {}
+
+    async def test_shutdown_without_changes_skips_write(
+        self, coordinator, mock_api_client, hass_storage
+    ):
+        """Test shutdown doesn't write the store when no scenes changed."""
+        await coordinator.async_shutdown()
+
+        assert coordinator._scene_store.key not in hass_storage
+        mock_api_client.close.assert_awaited_once()
@@ -0,0 +1,36 @@
+"""Test Govee light platform."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from homeassistant.components.light import ColorMode
+
+from custom_components.govee.light import GoveeLightEntity
+from custom_components.govee.models import GoveeDeviceState, PowerCommand
+
+
+class TestGoveeLightEntityControls:
+    """Test GoveeLightEntity control methods."""
+
+    async def test_turn_on_already_on_writes_color_mode(
+        self, coordinator, mock_api_client, mock_light_device
+    ):
+        """Test switching an on light to RGB writes the new color mode."""
+        mock_api_client.control_device.return_value = True
+        device_id = mock_light_device.device_id
+        coordinator.devices[device_id] = mock_light_device
+        coordinator.states[device_id] = GoveeDeviceState(
+            device_id=device_id, online=True, power_state=True, color_temp_kelvin=4000
+        )
+        entity = GoveeLightEntity(coordinator, mock_light_device)
+        entity.async_write_ha_state = MagicMock()
+        assert entity.color_mode == ColorMode.COLOR_TEMP
+
+        await entity.async_turn_on(rgb_color=(255, 0, 0))
+
+        assert mock_api_client.control_device.await_args_list[-1].args[2] == (
+            PowerCommand(power_on=True)
+        )
+        assert entity.color_mode == ColorMode.RGB
+        entity.async_write_ha_state.assert_called_once()
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from custom_components.govee.models import (
@@ -40,6 +45,11 @@ from custom_components.govee.models.device import (
 )
 
 
+def _fields(state: GoveeDeviceState, *names: str) -> dict[str, object]:
+    """Snapshot selected state fields so they can be asserted in one compare."""
+    return {name: getattr(state, name) for name in names}
+
+
 # ==============================================================================
 # RGBColor Tests
 # ==============================================================================
@@ -55,6 +65,10 @@ class TestRGBColor:
         assert color.g == 128
         assert color.b == 64
 
+    def test_from_packed_int_is_cached(self):
+        """Test repeated packed values share one immutable instance."""
+        assert RGBColor.from_packed_int(0xFF8040) is RGBColor.from_packed_int(16744512)
+
     def test_color_clamping(self):
         """Test that color values are clamped to 0-255."""
         color = RGBColor(r=300, g=-10, b=128)
@@ -97,14 +111,47 @@ class TestRGBColor:
 # ==============================================================================
 
 
+# (type, instance, expected detection flags) for parameterless capabilities
+_DETECTION_CASES = (
+    pytest.param(
+        CAPABILITY_ON_OFF,
+        INSTANCE_POWER,
+        {"is_power": True, "is_brightness": False},
+        id="power",
+    ),
+    pytest.param(
+        CAPABILITY_COLOR_SETTING,
+        INSTANCE_COLOR_RGB,
+        {"is_color_rgb": True, "is_color_temp": False},
+        id="color_rgb",
+    ),
+    pytest.param(
+        CAPABILITY_COLOR_SETTING,
+        INSTANCE_COLOR_TEMP,
+        {"is_color_temp": True, "is_color_rgb": False},
+        id="color_temp",
+    ),
+    pytest.param(CAPABILITY_DYNAMIC_SCENE, INSTANCE_SCENE, {"is_scene": True}, id="scene"),
+    pytest.param(
+        CAPABILITY_TOGGLE,
+        INSTANCE_OSCILLATION,
+        {"is_oscillation": True, "is_toggle": True, "is_night_light": False},
+        id="oscillation",
+    ),
+    pytest.param(
+        CAPABILITY_WORK_MODE, INSTANCE_WORK_MODE, {"is_work_mode": True}, id="work_mode"
+    ),
+)
+
+
 class TestGoveeCapability:
     """Test GoveeCapability model."""
 
-    def test_is_power(self):
-        """Test power capability detection."""
-        cap = GoveeCapability(type=CAPABILITY_ON_OFF, instance=INSTANCE_POWER, parameters={})
-        assert cap.is_power is True
-        assert cap.is_brightness is False
+    @pytest.mark.parametrize(("type_", "instance", "flags"), _DETECTION_CASES)
+    def test_detection(self, type_, instance, flags):
+        """Test capability type detection flags."""
+        cap = GoveeCapability(type=type_, instance=instance, parameters={})
+        assert {flag: getattr(cap, flag) for flag in flags} == flags
 
     def test_is_brightness(self):
         """Test brightness capability detection."""
@@ -116,35 +163,6 @@ class TestGoveeCapability:
         assert cap.is_brightness is True
         assert cap.brightness_range == (0, 100)
 
-    def test_is_color_rgb(self):
-        """Test RGB color capability detection."""
-        cap = GoveeCapability(type=CAPABILITY_COLOR_SETTING, instance=INSTANCE_COLOR_RGB, parameters={})
-        assert cap.is_color_rgb is True
-        assert cap.is_color_temp is False
-
-    def test_is_color_temp(self):
-        """Test color temperature capability detection."""
-        cap = GoveeCapability(type=CAPABILITY_COLOR_SETTING, instance=INSTANCE_COLOR_TEMP, parameters={})
-        assert cap.is_color_temp is True
-        assert cap.is_color_rgb is False
-
-    def test_is_scene(self):
-        """Test scene capability detection."""
-        cap = GoveeCapability(type=CAPABILITY_DYNAMIC_SCENE, instance=INSTANCE_SCENE, parameters={})
-        assert cap.is_scene is True
-
-    def test_is_oscillation(self):
-        """Test oscillation capability detection (fans)."""
-        cap = GoveeCapability(type=CAPABILITY_TOGGLE, instance=INSTANCE_OSCILLATION, parameters={})
-        assert cap.is_oscillation is True
-        assert cap.is_toggle is True
-        assert cap.is_night_light is False
-
-    def test_is_work_mode(self):
-        """Test work mode capability detection (fans)."""
-        cap = GoveeCapability(type=CAPABILITY_WORK_MODE, instance=INSTANCE_WORK_MODE, parameters={})
-        assert cap.is_work_mode is True
-
     def test_is_hdmi_source(self):
         """Test HDMI source mode capability detection."""
         cap = GoveeCapability(
@@ -181,6 +199,49 @@ class TestGoveeCapability:
         with pytest.raises(AttributeError):
             cap.type = "other"
 
+    def test_is_slotted(self):
+        """Test capabilities don't carry a per-instance __dict__."""
+        cap = GoveeCapability(type=CAPABILITY_ON_OFF, instance=INSTANCE_POWER, parameters={})
+        assert not hasattr(cap, "__dict__")
+
+
+# Read-only device payloads with null capability data
+_API_NULL_CAPABILITIES: Mapping[str, Any] = MappingProxyType(
+    {"device": "AA:BB:CC:DD:EE:FF:00:99", "sku": "H6001", "capabilities": None}
+)
+
+_API_NULL_PARAMETERS: Mapping[str, Any] = MappingProxyType(
+    {
+        "device": "AA:BB:CC:DD:EE:FF:00:99",
+        "sku": "H6001",
+        "capabilities": (
+            {"type": CAPABILITY_ON_OFF, "instance": INSTANCE_POWER, "parameters": None},
+        ),
+    }
+)
+
+# (attribute, device fixture, expected) for single-flag detection
+_FLAG_CASES = (
+    pytest.param("supports_power", "mock_light_device", True, id="power_light"),
+    pytest.param("supports_power", "mock_plug_device", True, id="power_plug"),
+    pytest.param("supports_power", "mock_fan_device", True, id="power_fan"),
+    pytest.param("supports_power", "mock_hdmi_device", True, id="power_hdmi"),
+    pytest.param("supports_brightness", "mock_light_device", True, id="brightness"),
+    pytest.param("supports_rgb", "mock_light_device", True, id="rgb"),
+    pytest.param("supports_color_temp", "mock_light_device", True, id="color_temp"),
+    pytest.param("supports_scenes", "mock_light_device", True, id="scenes"),
+    pytest.param("supports_segments", "mock_rgbic_device", True, id="segments"),
+    pytest.param("is_plug", "mock_plug_device", True, id="plug"),
+    pytest.param("is_group", "mock_group_device", True, id="group"),
+    pytest.param("supports_oscillation", "mock_fan_device", True, id="oscillation"),
+    pytest.param("supports_work_mode", "mock_fan_device", True, id="work_mode"),
+    pytest.param("supports_hdmi_source", "mock_hdmi_device", True, id="hdmi_source"),
+    pytest.param("supports_dreamview", "mock_dreamview_device", True, id="dreamview"),
+    pytest.param(
+        "supports_dreamview", "mock_light_device", False, id="no_dreamview_on_light"
+    ),
+)
+
 
 # ==============================================================================
 # GoveeDevice Tests
@@ -205,37 +266,11 @@ class TestGoveeDevice:
         assert device.name == "Living Room Light"
         assert device.is_group is False
 
-    def test_supports_power(self, mock_light_device):
-        """Test power support detection."""
-        assert mock_light_device.supports_power is True
-
-    def test_supports_brightness(self, mock_light_device):
-        """Test brightness support detection."""
-        assert mock_light_device.supports_brightness is True
-
-    def test_supports_rgb(self, mock_light_device):
-        """Test RGB support detection."""
-        assert mock_light_device.supports_rgb is True
-
-    def test_supports_color_temp(self, mock_light_device):
-        """Test color temperature support detection."""
-        assert mock_light_device.supports_color_temp is True
-
-    def test_supports_scenes(self, mock_light_device):
-        """Test scene support detection."""
-        assert mock_light_device.supports_scenes is True
-
-    def test_supports_segments(self, mock_rgbic_device):
-        """Test segment support detection."""
-        assert mock_rgbic_device.supports_segments is True
-
-    def test_is_plug(self, mock_plug_device):
-        """Test plug detection."""
-        assert mock_plug_device.is_plug is True
-
-    def test_is_group(self, mock_group_device):
-        """Test group device detection."""
-        assert mock_group_device.is_group is True
+    @pytest.mark.parametrize(("attr", "fixture_name", "expected"), _FLAG_CASES)
+    def test_capability_flag(self, attr, fixture_name, expected, request):
+        """Test single capability and device-type flags."""
+        device = request.getfixturevalue(fixture_name)
+        assert getattr(device, attr) is expected
 
     def test_is_fan(self, mock_fan_device):
         """Test fan device detection."""
@@ -243,23 +278,11 @@ class TestGoveeDevice:
         assert mock_fan_device.is_plug is False
         assert mock_fan_device.is_light_device is False
 
-    def test_supports_oscillation(self, mock_fan_device):
-        """Test oscillation support detection (fans)."""
-        assert mock_fan_device.supports_oscillation is True
-
-    def test_supports_work_mode(self, mock_fan_device):
-        """Test work mode support detection (fans)."""
-        assert mock_fan_device.supports_work_mode is True
-
     def test_fan_not_light(self, mock_fan_device):
         """Test that fan devices are not detected as lights."""
         assert mock_fan_device.is_light_device is False
         assert mock_fan_device.supports_power is True
 
-    def test_supports_hdmi_source(self, mock_hdmi_device):
-        """Test HDMI source support detection."""
-        assert mock_hdmi_device.supports_hdmi_source is True
-
     def test_get_hdmi_source_options(self, mock_hdmi_device):
         """Test getting HDMI source options from device."""
         options = mock_hdmi_device.get_hdmi_source_options()
@@ -274,13 +297,30 @@ class TestGoveeDevice:
         options = mock_light_device.get_hdmi_source_options()
         assert options == []
 
-    def test_supports_dreamview(self, mock_dreamview_device):
-        """Test DreamView support detection."""
-        assert mock_dreamview_device.supports_dreamview is True
+    def test_get_capability(self, mock_light_device):
+        """Test capability lookup by type and instance."""
+        brightness = mock_light_device.get_capability(
+            CAPABILITY_RANGE, INSTANCE_BRIGHTNESS
+        )
+        assert brightness is not None and brightness.is_brightness is True
+        assert mock_light_device.get_capability(CAPABILITY_MODE, "unknown") is None
 
-    def test_no_dreamview_support(self, mock_light_device):
-        """Test that regular lights don't have DreamView support."""
-        assert mock_light_device.supports_dreamview is False
+    def test_scene_support_is_cached(self, mock_light_device):
+        """Test scanning properties are computed once per device."""
+        assert mock_light_device.supports_scenes is True
+        assert vars(mock_light_device)["supports_scenes"] is True
+
+    def test_equality_ignores_capability_index(self, mock_light_device):
+        """Test devices compare by their fields, not derived lookup tables."""
+        copy = GoveeDevice(
+            device_id=mock_light_device.device_id,
+            sku=mock_light_device.sku,
+            name=mock_light_device.name,
+            device_type=mock_light_device.device_type,
+            capabilities=mock_light_device.capabilities,
+        )
+        assert copy == mock_light_device
+        assert "_capability_index" not in repr(copy)
 
     def test_from_api_response(self, api_device_response):
         """Test creating device from API response."""
@@ -304,12 +344,63 @@ class TestGoveeDevice:
         assert device.supports_oscillation is True
         assert device.supports_work_mode is True
 
+    def test_from_api_response_interns_strings(self, api_device_response):
+        """Test repeated identifiers are shared across separately decoded devices."""
+        raw = json.dumps(dict(api_device_response))
+        first = GoveeDevice.from_api_response(json.loads(raw))
+        second = GoveeDevice.from_api_response(json.loads(raw))
+        assert first.sku is second.sku
+        assert first.device_type is second.device_type
+        assert first.capabilities[0].type is second.capabilities[0].type
+        assert first.capabilities[0].instance is second.capabilities[0].instance
+
+    def test_from_api_response_null_capabilities(self):
+        """Test null capabilities and parameters are treated as empty."""
+        device = GoveeDevice.from_api_response(_API_NULL_CAPABILITIES)
+        assert device.capabilities == ()
+
+        device = GoveeDevice.from_api_response(_API_NULL_PARAMETERS)
+        assert device.capabilities[0].parameters == {}
+
     def test_immutable(self, mock_light_device):
         """Test that GoveeDevice is immutable (frozen)."""
         with pytest.raises(AttributeError):
             mock_light_device.name = "New Name"
 
 
+# (API state payload fixture, expected fields) for update_from_api
+_API_UPDATE_CASES = (
+    pytest.param(
+        "api_state_response",
+        {
+            "online": True,
+            "power_state": True,
+            "brightness": 75,
+            "color": RGBColor(r=255, g=128, b=64),
+            "source": "api",
+        },
+        id="light",
+    ),
+    pytest.param(
+        "api_fan_state_response",
+        {
+            "online": True,
+            "power_state": True,
+            "oscillating": True,
+            "work_mode": 1,
+            "mode_value": 2,
+            "source": "api",
+        },
+        id="fan",
+    ),
+    pytest.param(
+        "api_hdmi_state_response",
+        {"online": True, "power_state": True, "hdmi_source": 2, "source": "api"},
+        id="hdmi",
+    ),
+)
+
+
 # ==============================================================================
 # GoveeDeviceState Tests
 # ==============================================================================
@@ -339,16 +430,19 @@ class TestGoveeDeviceState:
         assert state.power_state is False
         assert state.brightness == 100
 
-    def test_update_from_api(self, api_state_response):
-        """Test updating state from API response."""
+    def test_state_is_slotted(self):
+        """Test unknown attributes are rejected rather than silently stored."""
+        state = GoveeDeviceState.create_empty("test_id")
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.powr_state = True  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize(("fixture_name", "expected"), _API_UPDATE_CASES)
+    def test_update_from_api(self, fixture_name, expected, request):
+        """Test updating state from API responses."""
         state = GoveeDeviceState.create_empty("AA:BB:CC:DD:EE:FF:00:11")
-        state.update_from_api(api_state_response)
-        assert state.online is True
-        assert state.power_state is True
-        assert state.brightness == 75
-        assert state.color is not None
-        assert state.color.as_tuple == (255, 128, 64)
-        assert state.source == "api"
+        state.update_from_api(request.getfixturevalue(fixture_name))
+        assert _fields(state, *expected) == expected
 
     def test_update_from_mqtt(self, mqtt_state_message):
         """Test updating state from MQTT message."""
@@ -356,8 +450,7 @@ class TestGoveeDeviceState:
         state.update_from_mqtt(mqtt_state_message["state"])
         assert state.power_state is True
         assert state.brightness == 75
-        assert state.color is not None
-        assert state.color.as_tuple == (255, 128, 64)
+        assert state.color is not None and state.color.as_tuple == (255, 128, 64)
         assert state.source == "mqtt"
 
     def test_optimistic_power(self):
@@ -394,20 +487,11 @@ class TestGoveeDeviceState:
     def test_fan_state_fields(self):
         """Test fan-specific state fields."""
         state = GoveeDeviceState.create_empty("test_id")
-        assert state.oscillating is None
-        assert state.work_mode is None
-        assert state.mode_value is None
-
-    def test_update_fan_state_from_api(self, api_fan_state_response):
-        """Test updating fan state from API response."""
-        state = GoveeDeviceState.create_empty("AA:BB:CC:DD:EE:FF:00:44")
-        state.update_from_api(api_fan_state_response)
-        assert state.online is True
-        assert state.power_state is True
-        assert state.oscillating is True
-        assert state.work_mode == 1
-        assert state.mode_value == 2
-        assert state.source == "api"
+        assert _fields(state, "oscillating", "work_mode", "mode_value") == {
+            "oscillating": None,
+            "work_mode": None,
+            "mode_value": None,
+        }
 
     def test_optimistic_oscillation(self):
         """Test optimistic oscillation update (fans)."""
@@ -432,22 +516,6 @@ class TestGoveeDeviceState:
         state = GoveeDeviceState.create_empty("test_id")
         assert state.hdmi_source is None
 
-    def test_update_hdmi_source_from_api(self):
-        """Test updating HDMI source from API response."""
-        state = GoveeDeviceState.create_empty("test_id")
-        api_response = {
-            "capabilities": [
-                {
-                    "type": "devices.capabilities.mode",
-                    "instance": "hdmiSource",
-                    "state": {"value": 2},
-                },
-            ],
-        }
-        state.update_from_api(api_response)
-        assert state.hdmi_source == 2
-        assert state.source == "api"
-
     def test_optimistic_hdmi_source(self):
         """Test optimistic HDMI source update."""
         state = GoveeDeviceState.create_empty("test_id")